@@ -11,19 +11,23 @@ serial port, download all new logs for the DBI3, then convert all new logs
 to KML for that DBI3 SN.
 """
 # TODO Log download and conversions to rolling journal for historical reference.  Include edits
-from __future__ import print_function
 
 import errno
+import functools
 import os
+import re
 import argparse
 import cmd
-import glob
+import contextlib
 import sys
 import json
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timedelta
 
-from dbi3_access.lib.dbi3_log_conversion import Dbi3KmlList, Dbi3LogConversion
-from dbi3_access.lib.dbi3_log_downloads import DBI3LogDownload
+# The conversion (simplekml), download (pyserial) and config modules are imported where they
+# are used, so --help/--version and each command line branch only load what they need.
 from dbi3_access.lib.dbi3_common import (
     utc,
     DBI_ALL_LOG_FIELDS,
@@ -31,86 +35,203 @@ from dbi3_access.lib.dbi3_common import (
     DBI_CONF_FILE,
     DEF_LOG_PATH,
     DEF_KML_PATH,
+    HOME_PATH,
     Spinner,
 )
-from dbi3_access.lib.dbi3_config_options import Dbi3ConfigOptions
 from dbi3_access.lib.audit_utils import init_logger, get_log
 from dbi3_access.lib.__version__ import __version__
 
-try:  # Handle input for python 2/3
-    input = raw_input
-except NameError:
-    pass
-
 app_config = None  # App configuration object
-# DEV temporary flag for csv
-do_csv = False
+# --fields help text, formatted once
+_FIELDS_HELP = (
+    "Which DBI3 data fields should be included in the KML output, "
+    f"default={','.join(DBI_DEFAULT_LOG_FIELDS)}, "
+    f"choices={','.join(DBI_ALL_LOG_FIELDS)}, ALL turns on all fields"
+)
+# DEV temporary flag for csv, None or the data file extension: csv, feather or parquet
+do_csv = None
 
 # The concept of "new" files is based on the latest stored log/kml, not simply old missing files.
 
 
-def convert_new_logs(app_config):
+def _report_conversion(log_name, new_file, override, kml_name, rtn, rtn_str):
+    """Audit log the result of a non-interactive KML conversion
+
+    :param str log_name: DBI3 log filename
+    :param bool new_file: the log was flagged as new
+    :param dict override: log metadata overrides or None
+    :param str kml_name: KML output filename, without extension
+    :param int rtn: kml_convert status 0=success, 1=warning, -1=error
+    :param str rtn_str: kml_convert report string
+    """
+    # Formatting is deferred to the logging module, done only if a handler emits the record
+    new_yn = "Y" if new_file else "N"
+    if rtn < 0:
+        get_log().info(
+            "Convert FAILED %s to KML  new:%s  edits:%s   to %s\n%s",
+            log_name,
+            new_yn,
+            override,
+            kml_name,
+            rtn_str,
+        )
+    elif rtn > 0 and app_config.verbose:
+        # not converted warning (probably no GPS data)
+        get_log().info(
+            "Convert %s to KML  new:%s  edits:%s\n%s", log_name, new_yn, override, rtn_str
+        )
+    elif rtn == 0:
+        get_log().info(
+            "Converted %s to KML  new:%s  edits:%s\n%s", log_name, new_yn, override, rtn_str
+        )
+
+
+def convert_new_logs(app_config, skip_logs=()):
     """Convert new DBI3 logs to kml output
 
     For each DBI3 log file, if the corresponding kml file does not exists,
-    run the conversion.
+    run the conversion.  Each conversion is independent and CPU bound, so the
+    logs are distributed across a process pool.
 
     :param Dbi3ConfigOptions app_config: Application config object
+    :param set,str skip_logs: log names already converted in this run, a log without GPS
+        data writes no KML and would otherwise be converted again
     :return: none
     """
+    from dbi3_access.lib.dbi3_log_conversion import Dbi3KmlList, convert_many
+
     conv_list = Dbi3KmlList(config=app_config)
     conv_list.refresh_list()
-    for le in conv_list.conversion_list:
-        if le.new_file:  # only process files marked as new
-            if not app_config.verbose:
-                sp = Spinner()
-            dbi3_obj = Dbi3LogConversion(le.log_filename, app_config)
-            rtn, rtn_str = dbi3_obj.kml_convert(le.kml_filename)
-            if not app_config.verbose:
-                sp.stop()
-            if rtn < 0:
-                get_log().info(
-                    "Convert FAILED {} to KML  new:{}  edits:{}   to {}\n{}".format(
-                        le.log_name, "Y" if le.new_file else "N", le.override, le.kml_name, rtn_str
-                    )
-                )
-            elif rtn > 0 and app_config.verbose:
-                # not converted warning (probably no GPS data)
-                get_log().info(
-                    "Convert {} to KML  new:{}  edits:{}\n{}".format(
-                        le.log_name, "Y" if le.new_file else "N", le.override, rtn_str
-                    )
-                )
-            elif rtn == 0:
-                get_log().info(
-                    "Converted {} to KML  new:{}  edits:{}\n{}".format(
-                        le.log_name, "Y" if le.new_file else "N", le.override, rtn_str
-                    )
-                )
+    # only process new files
+    new_list = [
+        le for le in conv_list.conversion_list if le.new_file and le.log_name not in skip_logs
+    ]
+    if len(new_list) == 0:
+        return
+
+    with _maybe_spinner(app_config):
+        results = convert_many([(le.log_filename, le.kml_filename) for le in new_list], app_config)
+
+    for le, (rtn, rtn_str) in zip(new_list, results):
+        _report_conversion(le.log_name, le.new_file, le.override, le.kml_name, rtn, rtn_str)
+
+
+def _maybe_spinner(config):
+    """Spinner context for a batch of work.
+
+    A no-op context with verbose output, when stdout is not a terminal (e.g. piped to a
+    file), or when the DBI3_NO_SPINNER environment variable is set.
+
+    :param Dbi3ConfigOptions config: Application config object
+    :return: Spinner or contextlib.nullcontext, the context value is the Spinner or None
+    """
+    if config.verbose or os.environ.get("DBI3_NO_SPINNER") or not sys.stdout.isatty():
+        return contextlib.nullcontext()
+    return Spinner()
+
+
+def _kml_basename(start_dt, sn):
+    """KML output filename YYYYMMDD_hhmm_SNxxxxx (no extension) for a log start time
+
+    :param datetime start_dt: log start time
+    :param str sn: DBI3 serial number
+    :return str: KML basename
+    """
+    return (
+        f"{start_dt.year:04d}{start_dt.month:02d}{start_dt.day:02d}"
+        f"_{start_dt.hour:02d}{start_dt.minute:02d}_{sn}"
+    )
+
+
+async def _download_and_convert(down_load, log_list, downloads, conversions):
+    """Download new logs and convert each one to KML while the next one downloads.
+
+    The serial port is not reentrant so downloads run one at a time in a single worker
+    thread.  Each completed download is queued to a converter that runs kml_convert in
+    a separate process, overlapping the conversion with the next serial transfer.
+
+    The results are appended to the caller's lists as each step completes, so the work
+    done before a failure can still be reported (after the spinner has stopped).
+
+    :param DBI3LogDownload down_load: initialized DBI3 serial access object
+    :param list,LogList log_list: list of logs on the DBI3, new_file marks a download
+    :param list,str downloads: receives the download reports
+    :param list conversions: receives (LogList, kml_name, rtn, rtn_str) of each conversion
+    """
+    from dbi3_access.lib.dbi3_log_conversion import convert_log
+
+    loop = asyncio.get_running_loop()
+    queue = asyncio.Queue(maxsize=2)
+    p_path = os.path.join(app_config.log_path, down_load.dbi3_sn)
+
+    async def downloader(serial_pool):
+        new_list = [le for le in log_list if le.new_file]
+        next_names = [le.name_start for le in new_list[1:]] + [None]
+        for le, next_name in zip(new_list, next_names):
+            # the next log is queued on the DBI3 while this one downloads
+            res = await loop.run_in_executor(
+                serial_pool, down_load.get_DBI3_log, le.name_start, next_name
+            )
+            if res is not None:  # zero length logs are not written
+                downloads.append(res)
+                await queue.put(le)
+        await queue.put(None)  # flag the end of the downloads
+
+    async def converter(conv_pool):
+        while True:
+            le = await queue.get()
+            if le is None:
+                break
+            kml_name = _kml_basename(le.start_dt, down_load.dbi3_sn)
+            rtn, rtn_str = await loop.run_in_executor(
+                conv_pool,
+                convert_log,
+                os.path.join(p_path, le.log_name),
+                os.path.join(app_config.kml_path, kml_name),
+                app_config,
+            )
+            conversions.append((le, kml_name, rtn, rtn_str))
+
+    # The converter process is spawned, forking here would copy a process that already has
+    # the serial worker and spinner threads running.
+    with ThreadPoolExecutor(max_workers=1) as serial_pool, ProcessPoolExecutor(
+        max_workers=1, mp_context=multiprocessing.get_context("spawn")
+    ) as conv_pool:
+        await asyncio.gather(downloader(serial_pool), converter(conv_pool))
 
 
 def process_dbi():
     """Non-interactive DBI3 download/convert method.
     Download 'new' logs from the DBI3.  Convert 'new' downloaded logs to KML.
     'new' is defined as a log newer than what is currently on the PC.
+
+    Each log is converted as soon as it is downloaded, overlapping the conversion with the
+    next download.  Any remaining logs on the PC without a KML are converted at the end.
     """
+    from dbi3_access.lib.dbi3_log_downloads import DBI3LogDownload
+
     _verify_paths()  # ensure log/kml paths exist
 
     down_load = None
+    downloads = []
+    conversions = []
     try:
         # log list elements contain list 'startRad26, stopRad26, start_dt, stop_dt, log_filename'
         # The log list automatically marks new logs as selected for download.
         down_load = DBI3LogDownload(app_config)
-        if not app_config.verbose:
-            sp = Spinner()
-        log_list = down_load.get_DBI3_log_list(True)
-
-        if log_list is not None:
-            rtn = down_load.download_new_logs(log_list)
-        if not app_config.verbose:
-            sp.stop()
-        if rtn:
-            get_log().info("\n  ".join(rtn))
+        # Based on the SN of the DBI3 we are connected to, adjust the log path
+        app_config.update_dbi3_sn(down_load.dbi3_sn)
+        try:
+            with _maybe_spinner(app_config):
+                log_list = down_load.get_DBI3_log_list(True)
+                asyncio.run(_download_and_convert(down_load, log_list, downloads, conversions))
+        finally:
+            # Report the work that completed once the spinner has stopped, even when a
+            # download or conversion failed
+            if downloads:
+                get_log().info("\n  ".join(downloads))
+            for le, kml_name, rtn, rtn_str in conversions:
+                _report_conversion(le.log_name, le.new_file, le.override, kml_name, rtn, rtn_str)
 
     except IOError as e:
         if down_load is not None and down_load.dbi3_sn is not None:
@@ -118,13 +239,12 @@ def process_dbi():
         else:
             sn = "No SN"
         com = app_config.com_port if app_config.com_port is not None else "NoPort"
-        print("IO error with DBI3({}) on {}: {}".format(sn, com, e))
+        print(f"IO error with DBI3({sn}) on {com}: {e}")
         print("Skip DBI3 log downloads")
         return
 
-    # Based on the SN of the DBI3 we are connected to, adjust the log path
-    app_config.update_dbi3_sn(down_load.dbi3_sn)
-    convert_new_logs(app_config)
+    # Logs converted above are not converted again, even if they didn't produce a KML
+    convert_new_logs(app_config, {le.log_name for le, _, _, _ in conversions})
 
 
 CLI_sn_list = []  # list of current DBI3 SN? log directories
@@ -138,10 +258,43 @@ def filter_text():
     if app_config.CLI_skip_invalid:
         fl.append("skip_invalid")
     if app_config.CLI_age_limit:
-        fl.append("after-{}".format(app_config.CLI_age_limit.strftime("%Y_%m_%d_%H_%M_%S")))
+        fl.append(f"after-{app_config.CLI_age_limit.strftime('%Y_%m_%d_%H_%M_%S')}")
     return ":".join(fl)
 
 
+def _filter_clear():
+    app_config.CLI_new_logs = False
+    app_config.CLI_age_limit = None
+    app_config.CLI_skip_invalid = False
+
+
+def _filter_new():
+    app_config.CLI_new_logs = True
+    app_config.CLI_age_limit = None
+
+
+def _filter_old():
+    app_config.CLI_new_logs = False
+
+
+def _filter_valid():
+    app_config.CLI_skip_invalid = True
+
+
+def _filter_invalid():
+    app_config.CLI_skip_invalid = False
+
+
+# filter command keywords and the app_config update for each
+_FILTER_ACTIONS = {
+    "all": _filter_clear,
+    "none": _filter_clear,
+    "new": _filter_new,
+    "old": _filter_old,
+    "valid": _filter_valid,
+    "invalid": _filter_invalid,
+}
+
 Cmd_exit = False  # To allow Cmd exit to bubble up from nested commands, we use this global.
 
 
@@ -169,7 +322,7 @@ class Dbi3InteractiveCommandLine(cmd.Cmd):
     def do_help(self, *args):
         """List available commands with "help" or detailed help with "help cmd"."""
         cmd.Cmd.do_help(self, *args)
-        print("CURRENT LIST FILTER: [{}]".format(filter_text()))
+        print(f"CURRENT LIST FILTER: [{filter_text()}]")
 
     def do_doc(self, line):
         """Display basic application documentation."""
@@ -177,7 +330,7 @@ class Dbi3InteractiveCommandLine(cmd.Cmd):
 
     def do_version(self, line):
         """Display the DBI3cli software version string"""
-        print("DBI3cli version ({})\n".format(__version__))
+        print(f"DBI3cli version ({__version__})\n")
 
     def do_config(self, line):
         """Set port, log path, kml path"""
@@ -187,40 +340,30 @@ class Dbi3InteractiveCommandLine(cmd.Cmd):
         """Filter DBI3 logs in the list - all|new|old|valid|invalid|DD[,...}  where DD=age_limit in days"""
         if line == "":
             print(
-                "new_logs:{}  age_limit:{} Days  valid_only:{}".format(
-                    app_config.CLI_new_logs, app_config.age_limit, app_config.CLI_skip_invalid
-                )
+                f"new_logs:{app_config.CLI_new_logs}  age_limit:{app_config.age_limit} Days  "
+                f"valid_only:{app_config.CLI_skip_invalid}"
             )
             return
+        now = datetime.now(utc)
         for ln in line.split(","):
-            ln.strip()
-            if ln == "all" or ln == "none":
-                app_config.CLI_new_logs = False
-                app_config.CLI_age_limit = None
-                app_config.CLI_skip_invalid = False
-            elif ln == "new":
-                app_config.CLI_new_logs = True
-                app_config.CLI_age_limit = None
-            elif ln == "old":
-                app_config.CLI_new_logs = False
-            elif ln == "valid":
-                app_config.CLI_skip_invalid = True
-            elif ln == "invalid":
-                app_config.CLI_skip_invalid = False
-            else:
-                # Try to parse an age limit string
-                try:
-                    age = int(ln)
-                    if age <= 0:
-                        app_config.age_limit = None
-                        app_config.CLI_age_limit = None
-                    else:
-                        app_config.age_limit = age
-                        app_config.CLI_age_limit = datetime.now(utc) - timedelta(days=age)
-                except ValueError as e:
-                    print("ERROR: unknown filter time {} : {}".format(ln, e))
-                    continue
-        print("CURRENT LIST FILTER: [{}]".format(filter_text()))
+            ln = ln.strip()
+            action = _FILTER_ACTIONS.get(ln)
+            if action is not None:
+                action()
+                continue
+            # Try to parse an age limit string
+            try:
+                age = int(ln)
+                if age <= 0:
+                    app_config.age_limit = None
+                    app_config.CLI_age_limit = None
+                else:
+                    app_config.age_limit = age
+                    app_config.CLI_age_limit = now - timedelta(days=age)
+            except ValueError as e:
+                print(f"ERROR: unknown filter time {ln} : {e}")
+                continue
+        print(f"CURRENT LIST FILTER: [{filter_text()}]")
 
     def help_filter(self):
         print("Filter out the display of logs in the Logs and KML lists.")
@@ -241,7 +384,7 @@ class Dbi3InteractiveCommandLine(cmd.Cmd):
         try:
             Dbi3LogListCommands().cmdloop()
         except IOError as e:
-            print("Can not access DBI3: {}".format(e))
+            print(f"Can not access DBI3: {e}")
             if e.errno == errno.EACCES:
                 print(
                     "   On Linux you may need to add the user to the dialout group--\n"
@@ -255,11 +398,9 @@ class Dbi3InteractiveCommandLine(cmd.Cmd):
         automatically select it, else prompt for a specific SN to process.
         """
         global CLI_sn_list
-        CLI_sn_list = []
-        # Build a list of available SN subdirectories
-        for sd in sorted(glob.glob(os.path.join(app_config.log_path, "SN*"))):
-            if os.path.isdir(sd):
-                CLI_sn_list.append(os.path.basename(sd))
+        # Build a list of available SN subdirectories, the dirent type avoids a stat per entry
+        with os.scandir(app_config.log_path) as it:
+            CLI_sn_list = sorted(e.name for e in it if e.name.startswith("SN") and e.is_dir())
         if len(CLI_sn_list) == 1:
             # only one SN recorded, skip directly to KML
             process_sn = CLI_sn_list[0]
@@ -269,16 +410,16 @@ class Dbi3InteractiveCommandLine(cmd.Cmd):
         else:
             print("AVAILABLE DBI3 LOG SNs:")
             for i, dbi_sn in enumerate(CLI_sn_list, 1):
-                print("{}  {}".format(i, dbi_sn))
+                print(f"{i}  {dbi_sn}")
             new_val = input("Select line number of the SerialNumber to process: ").lower()
             try:
                 j = int(new_val)
                 if j < 1 or j > len(CLI_sn_list):
-                    print("Line index [{}] is out of range".format(j))
+                    print(f"Line index [{j}] is out of range")
                     return
                 process_sn = CLI_sn_list[j - 1]
             except Exception as e:
-                print("Can not select line [{}]: {}\n".format(new_val, e))
+                print(f"Can not select line [{new_val}]: {e}\n")
                 return
         Dbi3KmlConversionCommands(process_sn).cmdloop()
         return Cmd_exit  # Global to indicate exit from nested Cmd
@@ -295,6 +436,8 @@ class Dbi3InteractiveCommandLine(cmd.Cmd):
 
         See the DBI3 Instrument User Manual for setting definitions.
         """
+        from dbi3_access.lib.dbi3_log_downloads import DBI3LogDownload
+
         args = line.split()
         down_load = None
         report = ""
@@ -303,7 +446,7 @@ class Dbi3InteractiveCommandLine(cmd.Cmd):
             down_load = DBI3LogDownload(app_config)
             report, cfg_dict = down_load.get_DBI3_config()
         except IOError as e:
-            print("Can not access DBI3: {}".format(e))
+            print(f"Can not access DBI3: {e}")
             if e.errno == errno.EACCES:
                 print(
                     "   On Linux you may need to add the user to the dialout group--\n"
@@ -317,22 +460,22 @@ class Dbi3InteractiveCommandLine(cmd.Cmd):
         else:
             # open config report file and write the data.
             # Embed the SN and current UTC time in the filename.
-            time_string = datetime.now(utc).strftime("%Y%m%d_%H%M")
-            cfg_file = "DBI3_{}_{}.cfg".format(down_load.dbi3_sn, time_string)
+            now = datetime.now(utc)
+            time_string = (
+                f"{now.year:04d}{now.month:02d}{now.day:02d}_{now.hour:02d}{now.minute:02d}"
+            )
+            cfg_file = f"DBI3_{down_load.dbi3_sn}_{time_string}.cfg"
             cfg_file_path = os.path.join(app_config.log_path, cfg_file)
             # Add a header line to the report
             report.insert(
                 0,
-                "DBI3 {} configuration data on {} UTC".format(
-                    down_load.dbi3_sn, datetime.now(utc).strftime("%c")
-                ),
+                f"DBI3 {down_load.dbi3_sn} configuration data on {now.strftime('%c')} UTC",
             )
             with open(cfg_file_path, "w") as f:
-                for res in report:
-                    f.write(res + "\n")
+                f.write("\n".join(report) + "\n")
 
             if "json" in args:
-                cfg_file = "DBI3_{}_{}.json".format(down_load.dbi3_sn, time_string)
+                cfg_file = f"DBI3_{down_load.dbi3_sn}_{time_string}.json"
                 cfg_file_path = os.path.join(app_config.log_path, cfg_file)
                 with open(cfg_file_path, "w") as f:
                     json.dump(cfg_dict, f, indent=4)
@@ -352,6 +495,8 @@ class Dbi3LogListCommands(cmd.Cmd):
     prompt = "(DBI3:Logs) "
 
     def preloop(self):
+        from dbi3_access.lib.dbi3_log_downloads import DBI3LogDownload
+
         self.down_load = DBI3LogDownload(app_config)
         self.my_list = []  # this contains our selection flag and the Log list element
         self.do_refresh("")
@@ -361,39 +506,35 @@ class Dbi3LogListCommands(cmd.Cmd):
     def do_help(self, *args):
         """List available commands with "help" or detailed help with "help cmd"."""
         cmd.Cmd.do_help(self, *args)
-        print("CURRENT LIST FILTER: [{}]".format(filter_text()))
+        print(f"CURRENT LIST FILTER: [{filter_text()}]")
 
     def do_refresh(self, line):
         """Re-read the DBI3 log list"""
-        if not app_config.verbose:
-            sp = Spinner()  # py threading - DBI3 i/o does not yield to spinner :-(
-        self.my_list = []
-        for le in self.down_load.get_DBI3_log_list():
-            self.my_list.append([le.new_file, le])
-        if not app_config.verbose:
-            sp.stop()
-        print("DBI3 Log list length {}".format(len(self.my_list)))
+        # py threading - DBI3 i/o does not yield to spinner :-(
+        with _maybe_spinner(app_config):
+            self.my_list = []
+            for le in self.down_load.get_DBI3_log_list():
+                self.my_list.append([le.new_file, le])
+        print(f"DBI3 Log list length {len(self.my_list)}")
 
     def do_list(self, line):
         """Display the DBI3 logs available for download.
 Selected logs are marked with "*" after the line number.
 "list selected" limits list to only selected logs.
 """
-        print("\nCURRENT LIST FILTER: [{}]".format(filter_text()))
+        print(f"\nCURRENT LIST FILTER: [{filter_text()}]")
         only_sel = line == "selected"
         for i, le in enumerate(self.my_list):
-            if only_sel is False or le[0] is True:
-                print(
-                    "{:3d} {} {}{}  {} to {}  duration:{}".format(
-                        i,
-                        "*" if le[0] else " ",
-                        le[1].log_name,
-                        "(new)" if le[1].new_file else "     ",
-                        le[1].start_dt.astimezone().strftime("%H:%M:%S"),
-                        le[1].end_dt.astimezone().strftime("%H:%M:%S%z"),
-                        le[1].end_dt - le[1].start_dt,
-                    )
-                )
+            if only_sel and not le[0]:
+                continue
+            start_dt = le[1].start_dt.astimezone()
+            end_dt = le[1].end_dt.astimezone()
+            sel = "*" if le[0] else " "
+            new = "(new)" if le[1].new_file else "     "
+            print(
+                f"{i:3d} {sel} {le[1].log_name}{new}  {start_dt.strftime('%H:%M:%S')} to "
+                f"{end_dt.strftime('%H:%M:%S%z')}  duration:{end_dt - start_dt}"
+            )
 
     def do_select(self, line):
         """Select/deselect LOG list rows for KML conversion. [all, none, new, #, #-#, -#]"""
@@ -414,44 +555,56 @@ Selected logs are marked with "*" after the line number.
 
     def do_download(self, line):
         """Download the selected logs."""
-        for le in self.my_list:
-            if le[0]:  # list row is marked as selected
-                if not app_config.verbose:
-                    sp = Spinner()
-                res = self.down_load.get_DBI3_log(le[1].name_start)
-                le[0] = False  # clear the select flag
-                if not app_config.verbose:
-                    sp.stop()
-                get_log().info(res)
+        reports = []  # audit log (msg, args...) tuples, formatted when logged
+        try:
+            with _maybe_spinner(app_config) as sp:
+                selected = [le for le in self.my_list if le[0]]  # list rows marked as selected
+                next_names = [le[1].name_start for le in selected[1:]] + [None]
+                for le, next_name in zip(selected, next_names):
+                    if sp is not None:
+                        sp.update(le[1].log_name)
+                    # the next log is queued on the DBI3 while this one downloads
+                    reports.append((self.down_load.get_DBI3_log(le[1].name_start, next_name),))
+                    le[0] = False  # clear the select flag
+        finally:
+            # Report after the spinner has stopped so the output is not mixed up
+            for res in reports:
+                get_log().info(*res)
 
     def do_convert(self, line):
         """Download AND convert the selected logs."""
-        for le in self.my_list:
-            if le[0]:  # list row is marked as selected
-                if not app_config.verbose:
-                    sp = Spinner()
-                res = self.down_load.get_DBI3_log(le[1].name_start)
-                if not app_config.verbose:
-                    sp.stop()
-                get_log().info(res)
-                p_path = os.path.join(app_config.log_path, self.down_load.dbi3_sn)
-                kml_name = le[1].start_dt.strftime("%Y%m%d_%H%M_{}".format(self.down_load.dbi3_sn))
-                if not app_config.verbose:
-                    sp = Spinner()
-                dbi3_obj = Dbi3LogConversion(os.path.join(p_path, le[1].log_name), app_config)
-                rtn, rtn_str = dbi3_obj.kml_convert(os.path.join(app_config.kml_path, kml_name))
-                if not app_config.verbose:
-                    sp.stop()
-                if rtn < 0:
-                    get_log().info(
-                        "Convert {} to {} FAILED: {}".format(le[1].log_name, kml_name, rtn_str)
+        from dbi3_access.lib.dbi3_log_conversion import Dbi3LogConversion
+
+        reports = []  # audit log (msg, args...) tuples, formatted when logged
+        dbi3_sn = self.down_load.dbi3_sn
+        p_path = os.path.join(app_config.log_path, dbi3_sn)
+        try:
+            with _maybe_spinner(app_config) as sp:
+                for le in self.my_list:
+                    if not le[0]:  # list row is not selected
+                        continue
+                    if sp is not None:
+                        sp.update(le[1].log_name)
+                    reports.append((self.down_load.get_DBI3_log(le[1].name_start),))
+                    kml_name = _kml_basename(le[1].start_dt, dbi3_sn)
+                    dbi3_obj = Dbi3LogConversion(os.path.join(p_path, le[1].log_name), app_config)
+                    rtn, rtn_str = dbi3_obj.kml_convert(
+                        os.path.join(app_config.kml_path, kml_name)
                     )
-                elif rtn > 0 and app_config.verbose:
-                    get_log().info("Convert {} to KML : {}".format(le[1].log_name, rtn_str))
-                    le[0] = False  # clear the select flag
-                elif rtn == 0:
-                    get_log().info("Convert {} to KML\n{}".format(le[1].log_name, rtn_str))
-                    le[0] = False  # clear the select flag
+                    if rtn < 0:
+                        reports.append(
+                            ("Convert %s to %s FAILED: %s", le[1].log_name, kml_name, rtn_str)
+                        )
+                    elif rtn > 0 and app_config.verbose:
+                        reports.append(("Convert %s to KML : %s", le[1].log_name, rtn_str))
+                        le[0] = False  # clear the select flag
+                    elif rtn == 0:
+                        reports.append(("Convert %s to KML\n%s", le[1].log_name, rtn_str))
+                        le[0] = False  # clear the select flag
+        finally:
+            # Report after the spinner has stopped so the output is not mixed up
+            for res in reports:
+                get_log().info(*res)
 
     def do_delete(self, line):
         """Delete the selected log files on the DBI3"""
@@ -459,15 +612,14 @@ Selected logs are marked with "*" after the line number.
         for le in self.my_list:
             if le[0]:  # list row is marked as selected
                 new_val = input(
-                    "This will delete {} {} from the DBI3.\nAre you sure you want to continue? ".format(
-                        le[1].name_start, le[1].log_name
-                    )
+                    f"This will delete {le[1].name_start} {le[1].log_name} from the DBI3.\n"
+                    "Are you sure you want to continue? "
                 )
                 if new_val.startswith("y"):
                     self.down_load.delete_DBI3_log(le[1].name_start)
                     deleted_log = True
                     get_log().info(
-                        "Deleted log {} {} from the DBI3".format(le[1].log_name, le[1].name_start)
+                        "Deleted log %s %s from the DBI3", le[1].log_name, le[1].name_start
                     )
 
         # Delete has invalidated the list, so refresh
@@ -495,43 +647,54 @@ class Dbi3KmlConversionCommands(cmd.Cmd):
 
     def __init__(self, dbi_sn):
         cmd.Cmd.__init__(self)
-        self.prompt = "(DBI3:KML:{}) ".format(dbi_sn)
+        self.prompt = f"(DBI3:KML:{dbi_sn}) "
         self.sn_log_path = os.path.join(app_config.log_path, dbi_sn)
         app_config.update_dbi3_sn(dbi_sn)
         self.conv_list = None
         self.my_list = []
 
     def preloop(self):
+        from dbi3_access.lib.dbi3_log_conversion import Dbi3KmlList
+
         print("Reading the list of KML files...")
         self.conv_list = Dbi3KmlList(app_config)
         self.do_refresh("")  # Use the refresh command handler to fill the list
-        print("KML list length {}".format(len(self.my_list)))
+        print(f"KML list length {len(self.my_list)}")
         self.do_help("")
 
     def do_help(self, *args):
         """List available commands with "help" or detailed help with "help cmd"."""
         cmd.Cmd.do_help(self, *args)
-        print("CURRENT LIST FILTER: [{}]".format(filter_text()))
+        print(f"CURRENT LIST FILTER: [{filter_text()}]")
 
     def do_refresh(self, line):
         """Re-read the local DBI3 logs available for KML conversion, reset selections"""
-        if not app_config.verbose:
-            sp = Spinner()
-        self.conv_list.refresh_list()
-        self.my_list = []
-        for le in self.conv_list.conversion_list:
-            dbi3_obj = Dbi3LogConversion(le.log_filename, app_config)
-            log_stats = dbi3_obj.log_summary()
-            if app_config.CLI_skip_invalid:
-                if log_stats.status <= 0:
-                    if app_config.verbose:
-                        print("Log {} dropped from list for status {} <= 0".format(le.log_name, log_stats.status))
-                    continue
-            # create my_list from conversion_list.  automatically select "new_file" and add the
-            # field for KML track statistics.
-            self.my_list.append([le.new_file, le, log_stats])
-        if not app_config.verbose:
-            sp.stop()
+        from dbi3_access.lib.dbi3_log_conversion import Dbi3LogConversion
+
+        with _maybe_spinner(app_config):
+            self.conv_list.refresh_list()
+            self.my_list = []
+            for le in self.conv_list.conversion_list:
+                if le.new_file:
+                    # New logs are pre-selected for conversion, keep the parsed log so do_convert
+                    # does not parse it again.
+                    dbi3_obj = Dbi3LogConversion(le.log_filename, app_config)
+                    log_stats = dbi3_obj.log_summary()
+                else:
+                    dbi3_obj = None
+                    log_stats = _cached_log_summary(
+                        le.log_filename, _file_key(le.log_filename), _file_key(le.meta_name)
+                    )
+                if app_config.CLI_skip_invalid:
+                    if log_stats.status <= 0:
+                        if app_config.verbose:
+                            print(
+                                f"Log {le.log_name} dropped from list for status {log_stats.status} <= 0"
+                            )
+                        continue
+                # create my_list from conversion_list.  automatically select "new_file" and add the
+                # field for KML track statistics and the parsed log (or None).
+                self.my_list.append([le.new_file, le, log_stats, dbi3_obj])
 
     def do_list(self, line):
         """Display the DBI3 logs available for KML conversion.
@@ -540,33 +703,29 @@ Selected logs are marked with "*" after the line number.
 "list long" prints an additional line of info per log file.
 """
         # Create and display a filter status line based on the settings
-        print("\nCURRENT LIST FILTER: [{}]".format(filter_text()))
+        status = filter_text()
+        print(f"\nCURRENT LIST FILTER: [{status}]")
         args = line.split()
         only_sel = "selected" in args
         long_list = "long" in args
         for i, le in enumerate(self.my_list):
             if only_sel and not le[0]:
                 continue
+            sel = "*" if le[0] else " "
+            new = "(new)" if le[1].new_file else "     "
+            edits = "Y" if le[1].override else " "
+            valid = le[2].status > 0
+            duration = le[2].gps_end - le[2].gps_start if valid else "---"
             print(
-                "{:3d} {} {}{}  edits:{}  rcrds:{:5d}  duration:{}".format(
-                    i,
-                    "*" if le[0] else " ",
-                    le[1].log_name,
-                    "(new)" if le[1].new_file else "     ",
-                    "Y" if le[1].override else " ",
-                    le[2].status,
-                    le[2].gps_end - le[2].gps_start if le[2].status > 0 else "---",
-                )
+                f"{i:3d} {sel} {le[1].log_name}{new}  edits:{edits}  rcrds:{le[2].status:5d}  "
+                f"duration:{duration}"
             )
-            if long_list:
-                print(
-                    "       {} to {}".format(
-                        le[2].gps_start.astimezone().strftime("%H:%M:%S"),
-                        le[2].gps_end.astimezone().strftime("%H:%M:%S%z"),
-                    )
-                )
+            if long_list and valid:  # invalid logs have no GPS times
+                start = le[2].gps_start.astimezone().strftime("%H:%M:%S")
+                end = le[2].gps_end.astimezone().strftime("%H:%M:%S%z")
+                print(f"       {start} to {end}")
         # Reminder about the current list filter
-        print("CURRENT LIST FILTER: [{}]\n".format(filter_text()))
+        print(f"CURRENT LIST FILTER: [{status}]\n")
 
     def do_select(self, line):
         """Select/deselect LOG list rows for KML conversion. [all, none, new, #, #-#, -#]"""
@@ -594,54 +753,71 @@ Selected logs are marked with "*" after the line number.
             print("Requires a line number to edit from the current list output")
             return
         except Exception as e:
-            print("Unable to edit {}: {}".format(line, e))
+            print(f"Unable to edit {line}: {e}")
             return
 
-        print("\nConversion options for: {}".format(le[1].log_name))
+        print(f"\nConversion options for: {le[1].log_name}")
         app_config.edit_conversion_config(le[1].meta_name)
         self.do_refresh("")  # heavy hammer! Assume edit affected the list and refresh
 
     def do_convert(self, line):
         """Convert the currently selected DBI3 logs to KML"""
-        # le array, [0]=select bool, [1]=ConversionList namedtuple
-        for le in self.my_list:
-            if le[0]:
-                if not app_config.verbose:
-                    sp = Spinner()
-                dbi3_obj = Dbi3LogConversion(le[1].log_filename, app_config)
-                rtn, rtn_str = dbi3_obj.kml_convert(le[1].kml_filename)
-                if not app_config.verbose:
-                    sp.stop()
-                if rtn < 0:
-                    get_log().info(
-                        "Convert {} to KML {} FAILED: {}".format(
-                            le[1].log_name, le[1].kml_name, rtn_str
-                        )
-                    )
-                elif rtn > 0 and app_config.verbose:
-                    get_log().info("Convert {} to KML: {}".format(le[1].log_name, rtn_str))
-                    le[0] = False  # clear the select flag
-                elif rtn == 0:
-                    get_log().info("Convert {} to KML\n{}".format(le[1].log_name, rtn_str))
-                    le[0] = False  # clear the select flag
+        # le array, [0]=select bool, [1]=ConversionList namedtuple, [2]=SummaryList,
+        # [3]=Dbi3LogConversion already parsed by do_refresh or None
+        from dbi3_access.lib.dbi3_log_conversion import Dbi3LogConversion
 
-                # TODO - this is a temporary hack for development
-                #        csv enabled by command line flag
-                if do_csv:
-                    csv_filename = os.path.join(
-                        os.path.expanduser("~"), "Documents", le[1].kml_name + ".csv"
-                    )
-                    rtn, rtn_str = dbi3_obj.csv_convert(csv_filename)
+        reports = []  # audit log (msg, args...) tuples, formatted when logged
+        try:
+            with _maybe_spinner(app_config) as sp:
+                for le in self.my_list:
+                    if not le[0]:
+                        continue
+                    if sp is not None:
+                        sp.update(le[1].log_name)
+                    dbi3_obj = le[3]
+                    if dbi3_obj is None:
+                        dbi3_obj = Dbi3LogConversion(le[1].log_filename, app_config)
+                    rtn, rtn_str = dbi3_obj.kml_convert(le[1].kml_filename)
                     if rtn < 0:
-                        get_log().info(
-                            "Convert {} to CSV {} FAILED: {}".format(
-                                le[1].log_name, csv_filename, rtn_str
+                        reports.append(
+                            (
+                                "Convert %s to KML %s FAILED: %s",
+                                le[1].log_name,
+                                le[1].kml_name,
+                                rtn_str,
                             )
                         )
                     elif rtn > 0 and app_config.verbose:
-                        get_log().info("Convert {} to CSV: {}".format(le[1].log_name, rtn_str))
+                        reports.append(("Convert %s to KML: %s", le[1].log_name, rtn_str))
+                        le[0] = False  # clear the select flag
                     elif rtn == 0:
-                        get_log().info("Convert {} to CSV\n{}".format(le[1].log_name, rtn_str))
+                        reports.append(("Convert %s to KML\n%s", le[1].log_name, rtn_str))
+                        le[0] = False  # clear the select flag
+
+                    # TODO - this is a temporary hack for development
+                    #        csv enabled by command line flag
+                    if do_csv:
+                        csv_filename = os.path.join(
+                            HOME_PATH, "Documents", le[1].kml_name + "." + do_csv
+                        )
+                        rtn, rtn_str = dbi3_obj.csv_convert(csv_filename)
+                        if rtn < 0:
+                            reports.append(
+                                (
+                                    "Convert %s to CSV %s FAILED: %s",
+                                    le[1].log_name,
+                                    csv_filename,
+                                    rtn_str,
+                                )
+                            )
+                        elif rtn > 0 and app_config.verbose:
+                            reports.append(("Convert %s to CSV: %s", le[1].log_name, rtn_str))
+                        elif rtn == 0:
+                            reports.append(("Convert %s to CSV\n%s", le[1].log_name, rtn_str))
+        finally:
+            # Report after the spinner has stopped so the output is not mixed up
+            for res in reports:
+                get_log().info(*res)
 
     def do_back(self, line):
         """Back to Main menu"""
@@ -656,6 +832,36 @@ Selected logs are marked with "*" after the line number.
     do_exit = do_EOF
 
 
+def _file_key(filename):
+    """Return (mtime, size) identifying the current state of a file, None if it does not exist"""
+    try:
+        st = os.stat(filename)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+@functools.lru_cache(maxsize=4096)
+def _cached_log_summary(log_filename, log_key, meta_key):
+    """Parse a DBI3 log for its summary, memoized for repeated KML list refreshes.
+
+    The summary depends on the log and its metadata overrides (e.g. trim times), so the
+    _file_key() of both are part of the cache key.  An edited file is parsed again.
+
+    :param str log_filename: Full path to the DBI3 log file
+    :param tuple log_key: _file_key() of the log file
+    :param tuple meta_key: _file_key() of the log metadata file
+    :return SummaryList: log summary
+    """
+    from dbi3_access.lib.dbi3_log_conversion import Dbi3LogConversion
+
+    return Dbi3LogConversion(log_filename, app_config, summary_only=True).log_summary()
+
+
+# select specifier N, -N, N-N, or -N-N.  Leading "-" is a deselect.
+_SEL_RE = re.compile(r"^(-?)(\d+)(?:-(\d+))?$")
+
+
 def process_select_range(line, my_list):
     """Given selection string, process the list to update the select flag
 
@@ -665,99 +871,77 @@ def process_select_range(line, my_list):
     The selection string can be one or more comma separated specifiers:
       all
       none
+      new
       N
       -N
       N-N
       -N-N
 
+    All specifiers are validated before any row is changed, an invalid specifier leaves
+    my_list untouched.
+
     :param str line: String containing one or more comma separated selection specs
     :param list my_list: list of rows, each row is a list of two elements, select=T/F and dictionary
     :result: my_list select field is altered as specified
     """
-    ln = line.lower()
-    for line in ln.split(","):
-        line = line.strip()
-        if line == "":
+    # First pass, validate and collect (sel, beg_idx, end_idx).  sel=None selects new rows.
+    sel_ops = []
+    for spec in [t.strip() for t in line.lower().split(",")]:
+        if spec == "":
             continue
-        sel = None
-        sel_new = False
-        if "all" in line:
-            sel = True
-        elif "none" in line:
-            sel = False
-        elif "new" in line:
-            sel_new = True
-        if sel is not None or sel_new:
-            for le in my_list:
-                if not sel_new:
-                    le[0] = sel
-                else:
-                    le[0] = le[1].new_file
-            continue  # Done with this select specifier
-
-        # not a full sweep so check for specific numbers
-        # Leading '-' indicates this is a deselect
-        # TODO collect all indicies before changing anything
-        if line[0] == "-":
-            sel_spec = line[1:]
-            sel = False
+        if spec == "all":
+            sel_ops.append((True, 0, len(my_list)))
+        elif spec == "none":
+            sel_ops.append((False, 0, len(my_list)))
+        elif spec == "new":
+            sel_ops.append((None, 0, len(my_list)))
         else:
-            sel_spec = line
-            sel = True
-        # now process for N or N-N
-        rng_spec = sel_spec.split("-")
-        if rng_spec[0] == "":
-            print("ERROR: invalid select specifier {}".format(sel_spec))
-        try:
-            beg_idx = int(rng_spec[0])
-        except ValueError:
-            print("ERROR: invalid select specifier {}".format(line))
-            return
-        if len(rng_spec) == 1:
-            end_idx = beg_idx + 1
-        else:
-            try:
-                end_idx = int(rng_spec[1]) + 1
-            except ValueError:
-                print("ERROR: invalid select specifier {}".format(line))
+            m = _SEL_RE.match(spec)
+            if m is None:
+                print(f"ERROR: invalid select specifier {spec}")
                 return
-        if beg_idx < 0 or beg_idx >= len(my_list) or end_idx <= beg_idx or end_idx > len(my_list):
-            print("ERROR: valid select index range is 0 through {}".format(len(my_list) - 1))
-            return
-        for i in range(beg_idx, end_idx):
-            my_list[i][0] = sel
+            beg_idx = int(m.group(2))
+            end_idx = beg_idx + 1 if m.group(3) is None else int(m.group(3)) + 1
+            if beg_idx >= len(my_list) or end_idx <= beg_idx or end_idx > len(my_list):
+                print(f"ERROR: valid select index range is 0 through {len(my_list) - 1}")
+                return
+            sel_ops.append((m.group(1) == "", beg_idx, end_idx))
+
+    # Second pass, apply the selections in order
+    for sel, beg_idx, end_idx in sel_ops:
+        for le in my_list[beg_idx:end_idx]:
+            le[0] = le[1].new_file if sel is None else sel
 
 
 def __verify_log_path(a_path):
-    """Verify a directory path exists or attempt to create the leaf"""
+    """Verify a directory path exists or attempt to create it"""
     try:
-        os.mkdir(a_path)
+        os.makedirs(a_path, exist_ok=True)
     except OSError:
-        if not os.path.isdir(a_path):
-            return False
+        return False
     return True
 
 
 def _verify_paths():
-    """Verify the log and kml paths exist or exit the application"""
-    if not os.path.isdir(app_config.log_path):
-        print("Log file path {} does not exist.".format(app_config.log_path))
+    """Verify the log and kml paths exist (creating them if needed) or exit the application"""
+    if not __verify_log_path(app_config.log_path):
+        print(f"Log file path {app_config.log_path} can not be created.")
         exit()
-    if not os.path.isdir(app_config.kml_path):
-        print("KML file path {} does not exist.".format(app_config.kml_path))
+    if not __verify_log_path(app_config.kml_path):
+        print(f"KML file path {app_config.kml_path} can not be created.")
         exit()
 
 
-def main():
-    """Main to drive the command line parsing and dispatch.
+def _split_fields(fields):
+    """argparse type for --fields, a comma separated list of field names"""
+    return fields.split(",")
 
-    Default values are defined/altered in the following hierarchy:
-    1. hardwired in the code
-    2. override by .DBI3config
-    3. override by command line
-    """
-    global app_config
 
+def _build_parser():
+    """Build the command line parser, only called when there is more to do than --version.
+
+    :return argparse.ArgumentParser: DBI3cli parser
+    """
     ap_description = """
 Download and/or convert DBI3 log file(s) to KML format.  The
 application defaults to interactive mode to select and convert specific logs.
@@ -773,8 +957,6 @@ format is "YYYY_MM_DD_hh_mm_ss.log".  KML output to the kml_path has a filename
 "YYYYMMDD_hhmm_SNxxxxx.kml".
 """
 
-    # TODO Overwrite a debug log to catch operations and errors of a run.
-
     parser = argparse.ArgumentParser(description=ap_description, epilog=ap_epilog)
     parser.add_argument(
         "--sync",
@@ -793,12 +975,9 @@ format is "YYYY_MM_DD_hh_mm_ss.log".  KML output to the kml_path has a filename
     parser.add_argument(
         "--fields",
         action="store",
-        default=DBI_DEFAULT_LOG_FIELDS,
-        type=lambda s: s.split(","),
-        help="Which DBI3 data fields should be included in the KML output, default={}, "
-        + "choices={}, ALL turns on all fields".format(
-            ",".join(DBI_DEFAULT_LOG_FIELDS), ",".join(DBI_ALL_LOG_FIELDS)
-        ),
+        default=list(DBI_DEFAULT_LOG_FIELDS),
+        type=_split_fields,
+        help=_FIELDS_HELP,
     )
     parser.add_argument(
         "--altitudemode",
@@ -855,12 +1034,36 @@ format is "YYYY_MM_DD_hh_mm_ss.log".  KML output to the kml_path has a filename
     )
     parser.add_argument(
         "--csv",
-        action="store_true",
-        default=False,
-        help="DEVELOPMENT: if true, when kml:convert is run it will also output a csv file to the "
-        + "{HOME}/Documents directory",
+        nargs="?",
+        const="csv",
+        default=None,
+        choices=["csv", "feather", "parquet"],
+        help="DEVELOPMENT: if given, when kml:convert is run it will also output a csv file to the "
+        + "{HOME}/Documents directory.  feather or parquet selects that format instead, which "
+        + "needs the optional pyarrow package (the arrow extra)",
     )
-    args = parser.parse_args()
+    return parser
+
+
+def main():
+    """Main to drive the command line parsing and dispatch.
+
+    Default values are defined/altered in the following hierarchy:
+    1. hardwired in the code
+    2. override by .DBI3config
+    3. override by command line
+    """
+    global app_config
+
+    # TODO Overwrite a debug log to catch operations and errors of a run.
+
+    # --version needs none of the parser or config setup
+    if sys.argv[1:] in (["-V"], ["--version"]):
+        print(f"{os.path.basename(sys.argv[0])} ({__version__})")
+        return 0
+    args = _build_parser().parse_args()
+
+    from dbi3_access.lib.dbi3_config_options import Dbi3ConfigOptions
 
     # DEV temporary csv flag
     global do_csv
@@ -890,21 +1093,22 @@ format is "YYYY_MM_DD_hh_mm_ss.log".  KML output to the kml_path has a filename
         # use any existing config file plus command line options.
         if args.file.startswith("~/"):
             # Handle HOME directory expansion
-            args.file = os.path.join(os.path.expanduser("~"), args.file[2:])
-        args.file = os.path.realpath(args.file)  # clean up the path
+            args.file = os.path.join(HOME_PATH, args.file[2:])
+        args.file = os.path.normpath(os.path.abspath(args.file))  # clean up the path
         kml_file = os.path.splitext(args.file)[0] + "_DBI3"
-        if not app_config.verbose:
-            sp = Spinner()
-        dbi3_obj = Dbi3LogConversion(args.file, app_config, altitude_offset=args.altitude_offset)
-        rtn, rtn_str = dbi3_obj.kml_convert(kml_file)
-        if not app_config.verbose:
-            sp.stop()
+        from dbi3_access.lib.dbi3_log_conversion import Dbi3LogConversion
+
+        with _maybe_spinner(app_config):
+            dbi3_obj = Dbi3LogConversion(
+                args.file, app_config, altitude_offset=args.altitude_offset
+            )
+            rtn, rtn_str = dbi3_obj.kml_convert(kml_file)
         if rtn < 0:
-            print("Convert {} to {} FAILED: {}".format(args.file, kml_file, rtn_str))
+            print(f"Convert {args.file} to {kml_file} FAILED: {rtn_str}")
         elif rtn > 0 and app_config.verbose:
-            print("Convert {} to KML: {}".format(args.file, rtn_str))
+            print(f"Convert {args.file} to KML: {rtn_str}")
         elif rtn == 0:
-            print("Convert {} to KML\n{}".format(args.file, rtn_str))
+            print(f"Convert {args.file} to KML\n{rtn_str}")
 
     elif args.sync:
         # Non-interactive sync with the DBI3
@@ -920,13 +1124,13 @@ format is "YYYY_MM_DD_hh_mm_ss.log".  KML output to the kml_path has a filename
     else:
         if not os.path.isfile(DBI_CONF_FILE):
             print("\n########## Initial Configuration ##########\n")
-            print("The default location for DBI3 log files is:\n    {}".format(DEF_LOG_PATH))
-            print("And the default for KML output files is:\n    {}".format(DEF_KML_PATH))
+            print(f"The default location for DBI3 log files is:\n    {DEF_LOG_PATH}")
+            print(f"And the default for KML output files is:\n    {DEF_KML_PATH}")
             new_val = input("Is this OK (y/n)? ").lower()
             if new_val.startswith("y"):
                 app_config.non_interactive_auto_config()
             # Regardless of auto_config, drop into config edit.
-            print("log_path {} kml_path {}".format(app_config.log_path, app_config.kml_path))
+            print(f"log_path {app_config.log_path} kml_path {app_config.kml_path}")
             app_config.edit_config()
 
         _verify_paths()
@@ -9,41 +9,31 @@ DBI3 common definitions/declarations
 """
 import os
 import sys
+import itertools
 import threading
-import collections
+from datetime import datetime, timezone
+from typing import NamedTuple, Optional
 
-try:
-    from datetime import timezone
-
-    utc = timezone.utc
-except ImportError:
-    """Python 2 doesn't have timezone module, define UTC here."""
-    from datetime import tzinfo, timedelta
-
-    class UTC(tzinfo):
-        """UTC tzinfo"""
-
-        def utcoffset(self, dt):
-            return timedelta(0)
-
-        def tzname(self, dt):
-            return "UTC"
-
-        def dst(self, dt):
-            return timedelta(0)
-
-    utc = UTC()  # tzinfo for UTC
+utc = timezone.utc  # tzinfo for UTC
 
 UTC_FMT = "%Y-%m-%d %H:%M:%S"  # strftime format for UTC output
 
-DBI_CONF_FILE = os.path.join(os.path.expanduser("~"), ".DBI3config")  # hidden DBI3 config filename
-DEF_LOG_PATH = os.path.join(os.path.expanduser("~"), "Documents", "DBI3logs")
+HOME_PATH = os.path.expanduser("~")  # user HOME directory, resolved once
+DBI_CONF_FILE = os.path.join(HOME_PATH, ".DBI3config")  # hidden DBI3 config filename
+DEF_LOG_PATH = os.path.join(HOME_PATH, "Documents", "DBI3logs")
 DEF_KML_PATH = os.path.join(DEF_LOG_PATH, "kml")
 
+
 # Define named tuples for DBI3 KML conversion list entries
-ConversionList = collections.namedtuple(
-    "ConversionList", "log_name log_filename kml_name kml_filename new_file meta_name override"
-)
+class ConversionList(NamedTuple):
+    log_name: str
+    log_filename: str
+    kml_name: str
+    kml_filename: str
+    new_file: bool
+    meta_name: str
+    override: Optional[dict]
+
 
 # Summary from dbi3_log_parse
 # status - int number of GPS data records or -1 for failure
@@ -51,9 +41,13 @@ ConversionList = collections.namedtuple(
 # gps_end - datetime
 # min_altitude - Meters
 # max_altitude - Meters
-SummaryList = collections.namedtuple(
-    "SummaryList", "status, gps_start, gps_end, min_altitude, max_altitude"
-)
+class SummaryList(NamedTuple):
+    status: int
+    gps_start: Optional[datetime]
+    gps_end: Optional[datetime]
+    min_altitude: Optional[float]
+    max_altitude: Optional[float]
+
 
 # Define named tuple for DBI3 LOG list entries
 #  name_start - RAD26 string of start time
@@ -64,42 +58,73 @@ SummaryList = collections.namedtuple(
 #  new_file - boolean new file, does not exist on the PC
 #  meta_name - string, filename of metadata
 #  override - dictionary of optional metadata or None
-LogList = collections.namedtuple(
-    "LogList", "name_start name_end start_dt end_dt log_name new_file meta_name override"
-)
+class LogList(NamedTuple):
+    name_start: str
+    name_end: str
+    start_dt: datetime
+    end_dt: datetime
+    log_name: str
+    new_file: bool
+    meta_name: str
+    override: Optional[dict]
+
 
 # There are many additional LOG fields that can be included in the KML.  These lists are the complete set,
 # and the default set used in KML conversions.  NOTE: DIFF is a calculated value=TOPT-AMBT
 # 25May20 - GPS ALT and PRES ALT are automatically added based on availability and GPS preference config
-DBI_ALL_LOG_FIELDS = ["ROC", "TOPT", "AMBT", "DIFF", "SOG", "COG", "BATM", "BRDT"]
-DBI_DEFAULT_LOG_FIELDS = ["ROC", "TOPT", "AMBT", "DIFF", "SOG", "COG"]
+# The tuples are immutable and keep the display order, the set is for membership tests.
+DBI_ALL_LOG_FIELDS = ("ROC", "TOPT", "AMBT", "DIFF", "SOG", "COG", "BATM", "BRDT")
+DBI_ALL_LOG_FIELDS_SET = frozenset(DBI_ALL_LOG_FIELDS)
+DBI_DEFAULT_LOG_FIELDS = ("ROC", "TOPT", "AMBT", "DIFF", "SOG", "COG")
 
 
 class Spinner:
     """Create a thread printing a spinner character until commanded to stop.
 
+    One Spinner can span a whole batch of work, update() displays a progress
+    message (e.g. the current log name) ahead of the spinner character.
+
     Other output while the spinner is running will get mixed up, so don't
     use this with verbose output.
+
+    Use it as a context manager so the spinner thread is stopped even if the work raises.
     """
 
     def __init__(self):
+        self.message = None
         self.e = threading.Event()
         self.t = threading.Thread(target=self.spin, args=(self.e,))
         self.t.start()
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def update(self, message):
+        """Display message ahead of the spinner character."""
+        self.message = message
+
     def stop(self):
         self.e.set()  # Flag the thread to stop
         self.t.join(2.0)
 
-    @staticmethod
-    def spin(e):
-        spin_char = r"\|/-\|/-"
-        while True:
-            for ch in spin_char:
-                sys.stdout.write(ch)
-                sys.stdout.flush()
-                xit = e.wait(0.2)  # wait for 1/4 sec or exit event
-                sys.stdout.write("\b")
-                sys.stdout.flush()
-                if xit:
-                    return
+    def spin(self, e):
+        shown = None  # message currently displayed
+        width = 0  # longest message displayed, to erase the line
+        # One write per tick, the backspace leaves the cursor on the spinner character
+        for ch in itertools.cycle(r"\|/-"):
+            message = self.message
+            if message is not shown:
+                sys.stdout.write("\r{:<{}} {}\b".format(message, width, ch))
+                shown = message
+                width = max(width, len(message))
+            else:
+                sys.stdout.write(ch + "\b")
+            sys.stdout.flush()
+            if e.wait(0.2):  # wait for 1/5 sec or exit event
+                break
+        if shown is not None:
+            sys.stdout.write("\r{}\r".format(" " * (width + 2)))
+            sys.stdout.flush()
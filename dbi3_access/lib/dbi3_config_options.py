@@ -8,16 +8,18 @@
 from __future__ import print_function
 
 import os
+import stat
 import sys
 from datetime import datetime, time, timedelta
 import json
 import collections
-from serial.tools.list_ports import comports
 
 try:  # Handle either python 2/3 import syntax
     from dbi3_common import (
         utc,
+        HOME_PATH,
         DBI_ALL_LOG_FIELDS,
+        DBI_ALL_LOG_FIELDS_SET,
         DBI_DEFAULT_LOG_FIELDS,
         DBI_CONF_FILE,
         DEF_LOG_PATH,
@@ -26,7 +28,9 @@ try:  # Handle either python 2/3 import syntax
 except ImportError:
     from .dbi3_common import (
         utc,
+        HOME_PATH,
         DBI_ALL_LOG_FIELDS,
+        DBI_ALL_LOG_FIELDS_SET,
         DBI_DEFAULT_LOG_FIELDS,
         DBI_CONF_FILE,
         DEF_LOG_PATH,
@@ -76,6 +80,53 @@ ConfigSpec = collections.namedtuple(
     "ConfigSpec", "field_name name default validation_func direct help_txt"
 )
 
+# Parsed config files, path: ((st_mtime_ns, st_size), data)
+_config_cache = {}
+
+
+def _load_config_file(path):
+    """Read a JSON config file, only parsing it again when the file has changed.
+
+    :param str path: config file path
+    :return dict: copy of the parsed config, None if the file does not exist
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    if not stat.S_ISREG(st.st_mode):
+        return None
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _config_cache.get(path)
+    if cached is None or cached[0] != key:
+        with open(path, "r") as conf_file:
+            cached = (key, json.load(conf_file))
+        _config_cache[path] = cached
+    return dict(cached[1])  # callers may edit their copy
+
+
+def _trim_to_datetime(trim):
+    """Convert a metadata trim time to a UTC datetime.
+
+    Trim times are saved as fixed width YYYYMMDDhhmmss strings, the fields are sliced
+    instead of going through strptime.
+
+    :param str trim: trim time string
+    :return datetime: timezone aware trim time
+    :raise ValueError: trim is not a valid YYYYMMDDhhmmss time
+    """
+    if len(trim) != 14 or not trim.isdigit():
+        raise ValueError("trim time {!r} does not match format YYYYMMDDhhmmss".format(trim))
+    return datetime(
+        int(trim[0:4]),
+        int(trim[4:6]),
+        int(trim[6:8]),
+        int(trim[8:10]),
+        int(trim[10:12]),
+        int(trim[12:14]),
+        tzinfo=utc,
+    )
+
 
 class Dbi3ConfigOptions:
     """Initialize and maintain application config settings.
@@ -106,7 +157,7 @@ class Dbi3ConfigOptions:
         self.prefer_gps = True  # prefer GPS over pressure altitude if available
         self.altitudemode = "absolute"
         self.extend_to_ground = True
-        self.kml_fields = DBI_DEFAULT_LOG_FIELDS
+        self.kml_fields = list(DBI_DEFAULT_LOG_FIELDS)
         self.kml_use_metric = False
         # age_limit in days.  When age filter enabled, limit log/kml list outputs to newer
         self.age_limit = None
@@ -148,10 +199,9 @@ class Dbi3ConfigOptions:
         self.sn = sn
 
     def _update_config_from_file(self):
-        if os.path.isfile(self.conf_file):
-            with open(self.conf_file, "r") as conf_file:
-                data = json.load(conf_file)
-                print("DBI3 config file: {}".format(self.conf_file))
+        data = _load_config_file(self.conf_file)
+        if data is not None:
+            print("DBI3 config file: {}".format(self.conf_file))
             # For all defined config attributes, if it exists in the file, update our variable
             for field in DBI3_APPLICATION_CONFIG_ATTR:
                 if field in data:
@@ -168,10 +218,7 @@ class Dbi3ConfigOptions:
     Other parameters can be left as default.
     """
         )
-        data = {}
-        if os.path.isfile(self.conf_file):
-            with open(self.conf_file, "r") as conf_file:
-                data = json.load(conf_file)
+        data = _load_config_file(self.conf_file) or {}
         # print("CONFIG File Content-{}\m".format(json.dumps(data, indent=2)))
         AppConfig = [
             ConfigSpec(
@@ -490,7 +537,7 @@ class Dbi3ConfigOptions:
     def path_check(cls, param_name, new_path):
         if new_path.startswith("~/"):
             # Handle HOME directory expansion
-            new_path = os.path.join(os.path.expanduser("~"), new_path[2:])
+            new_path = os.path.join(HOME_PATH, new_path[2:])
         if not os.path.isdir(new_path):
             print("{} path {} does not exist.".format(param_name, new_path))
             new_val = input("Should I create the path (y/n)? ")
@@ -553,6 +600,8 @@ class Dbi3ConfigOptions:
         easier on systems with long device names, also allow the input of an
         index.
         """
+        from serial.tools.list_ports import comports
+
         sys.stderr.write("\n--- Available ports:\n")
         ports = []
         for n, (port, desc, hwid) in enumerate(sorted(comports(include_links=True)), 1):
@@ -582,12 +631,12 @@ class Dbi3ConfigOptions:
         # Verifiy the fields list and set the field names in a boolean dictionary
         if "ALL" in fl:
             # Special case, turns on all fields
-            return DBI_ALL_LOG_FIELDS
+            return list(DBI_ALL_LOG_FIELDS)
         for fn in fl:
-            if fn not in DBI_ALL_LOG_FIELDS:
+            if fn not in DBI_ALL_LOG_FIELDS_SET:
                 print(
                     'error: argument --fields: invalid choice: "{}" is not in "{}"'.format(
-                        fn, DBI_ALL_LOG_FIELDS
+                        fn, ",".join(DBI_ALL_LOG_FIELDS)
                     )
                 )
                 return None
@@ -595,12 +644,11 @@ class Dbi3ConfigOptions:
 
     @staticmethod
     def __verify_log_path(a_path):
-        """Verify a directory path exists or attempt to create the leaf"""
+        """Verify a directory path exists or attempt to create it"""
         try:
-            os.mkdir(a_path)
+            os.makedirs(a_path, exist_ok=True)
         except OSError:
-            if not os.path.isdir(a_path):
-                return False
+            return False
         return True
 
     def non_interactive_auto_config(self):
@@ -669,13 +717,9 @@ class Dbi3ConversionOptions:
                     setattr(self, field, data[field])
             # the trim fields need to be converted to datetime.
             if self.trim_start_time is not None:
-                self.trim_start_time = datetime.strptime(
-                    self.trim_start_time, "%Y%m%d%H%M%S"
-                ).replace(tzinfo=utc)
+                self.trim_start_time = _trim_to_datetime(self.trim_start_time)
             if self.trim_end_time is not None:
-                self.trim_end_time = datetime.strptime(self.trim_end_time, "%Y%m%d%H%M%S").replace(
-                    tzinfo=utc
-                )
+                self.trim_end_time = _trim_to_datetime(self.trim_end_time)
 
     def __str__(self):
         return (
@@ -9,27 +9,34 @@
 from __future__ import print_function
 import os
 import json
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from datetime import timedelta
-from simplekml import Kml, Snippet, Types
-import math
+from math import asin, atan2, cos, pi, sin, sqrt
 import re
+from array import array
+from itertools import islice
+from operator import itemgetter
 
 try:
-    from dbi3_common import ConversionList, SummaryList, utc, UTC_FMT, DBI_DEFAULT_LOG_FIELDS
-    from dbi3_log_downloads import DBI3LogDownload
-    from dbi3_config_options import Dbi3ConfigOptions, Dbi3ConversionOptions
-    from audit_utils import init_logger, get_log
+    from dbi3_common import ConversionList, SummaryList, utc, UTC_FMT
+    from dbi3_config_options import Dbi3ConversionOptions
+    from audit_utils import get_log
 except ImportError:
-    from .dbi3_common import ConversionList, SummaryList, utc, UTC_FMT, DBI_DEFAULT_LOG_FIELDS
-    from .dbi3_log_downloads import DBI3LogDownload
-    from .dbi3_config_options import Dbi3ConfigOptions, Dbi3ConversionOptions
-    from .audit_utils import init_logger, get_log
+    from .dbi3_common import ConversionList, SummaryList, utc, UTC_FMT
+    from .dbi3_config_options import Dbi3ConversionOptions
+    from .audit_utils import get_log
 
 TWO_SECONDS = timedelta(seconds=2)  # time increment between data records
 KML_LINE_COLOR = "ff0000ff"  # hex aabbggrr
 KML_START_COLOR = "ff00ff00"
 KML_END_COLOR = "ff0000ff"
+MISSING_TOPT_F = 100.0  # when TOPT is missing, we display this default data
+MISSING_TOPT_C = 40.0  # - or this
+M_TO_FT = 3.28084  # unit conversion factors, see conv_M_to_ft() and conv_M_to_mi()
+M_TO_MI = 0.000621371
+DEG_TO_RAD = pi / 180.0  # the factor math.radians() multiplies by
 
 # Required start record, data record, and end record fields - to validate log record content
 START_FIELDS = ["FWVER", "SN", "DATE", "TIME"]
@@ -48,6 +55,20 @@ DATA_FIELDS = [
     "BRDT",
 ]
 END_FIELDS = ["DATE", "TIME"]
+_get_data_fields = itemgetter(*DATA_FIELDS)  # DATA_FIELDS values tuple of a parsed record
+# The usual DATA record layout, DATA_FIELDS in order followed by BAR and the optional MSLALT
+# (fw ver 1.3 GPS altitude).  Captures the values in that order.
+_DATA_RE = re.compile(
+    " ".join(name + r"=([^\s=]*)" for name in DATA_FIELDS)
+    + r" BAR=([^\s=]*)(?: MSLALT=([^\s=]*))?$"
+)
+# A pretty printed KML line holding a track data placeholder, see _save_kml()
+_PLACEHOLDER_RE = re.compile(r"^( *)<(when|gx:value)>(DBI3_\w+)</\2>$", re.MULTILINE)
+# CSV rows formatted per write, about 1 MiB of text
+_CSV_BATCH_ROWS = 10000
+# DBI3 log name format, YYYY_MM_DD_HH_MM_SS.log
+_LOG_NAME_RE = re.compile(r"\d{4}_\d\d_\d\d_\d\d_\d\d_\d\d\.log")
+_LOG_NAME_LEN = len("YYYY_MM_DD_HH_MM_SS.log")
 
 
 class Dbi3Log:
@@ -55,7 +76,7 @@ class Dbi3Log:
     summary values across the log.
     """
 
-    def __init__(self, kml_cfg, filename, sn=None):
+    def __init__(self, kml_cfg, filename, sn=None, summary_only=False):
         """Initialize the DBI3LogConversion object
 
         Class will parse DBI3 track data from the log.
@@ -63,12 +84,15 @@ class Dbi3Log:
         :param Dbi3ConversionOptions kml_cfg:
         :param str filename:  Full path to DBI3 log file
         :param str sn:  optional DBI3 SN if known at constructor time
+        :param bool summary_only:  only parse what the log summary needs, the timestamps,
+            additional data fields and trip computer distance are not collected
 
         """
 
         self.filename = filename
         self.dbi3_sn = sn
         self.kml_cfg = kml_cfg
+        self.summary_only = summary_only
         self.dbi3_fwver = None
 
         self.proc_log = ""  # Accumulate print output from the entire conversion
@@ -103,24 +127,34 @@ class Dbi3Log:
         self.kml_coord_alt_gps = False
 
         # initialize data lists to construct the KML output.  Values are converted to
-        # metric/imperial per config.
+        # metric/imperial per config.  Numeric data is kept in packed double arrays.
         self.kml_start_time = None  # datetime of the first GPS data line
         self.kml_end_time = None  # datetime of the last GPS data line
         self.kml_when = []  # track point timestamp
-        self.kml_lat = []  # floating point degrees +=N -=S
-        self.kml_lon = []  # floating point degrees +=E -=W
-        self.kml_alt = []  # barometric altitude
-        self.kml_bar = []  # barometric hecto Pascal
-        self.kml_coord = []  # tuples: lat, lon, alt(meters)
-        self.kml_gps_msl = []
-        self.kml_a_temp = []
-        self.kml_t_temp = []
-        self.kml_diff_t = []
-        self.kml_cog = []
-        self.kml_sog = []
-        self.kml_roc = []
-        self.kml_batm = []
-        self.kml_brdt = []
+        self.kml_lat = array("d")  # floating point degrees +=N -=S
+        self.kml_lon = array("d")  # floating point degrees +=E -=W
+        self.kml_alt = array("d")  # barometric altitude
+        self.kml_bar = array("d")  # barometric hecto Pascal
+        self.kml_coord_alt = array("d")  # track point altitude (meters), pressure or GPS
+        self.kml_gps_msl = array("d")
+        self.kml_a_temp = array("d")
+        self.kml_t_temp = array("d")
+        self.kml_diff_t = array("d")
+        self.kml_cog = array("d")
+        self.kml_sog = array("d")
+        self.kml_roc = array("d")
+        self.kml_batm = array("d")
+        self.kml_brdt = array("d")
+        # raw additional data field columns until convert_data_fields()
+        self.data_field_cols = None
+
+    @property
+    def kml_coord(self):
+        """KML coordinate tuples: lon, lat, alt(meters), assembled from the data columns
+
+        Only KML output needs the coordinate tuples, parsing for a log summary does not.
+        """
+        return list(zip(self.kml_lon, self.kml_lat, self.kml_coord_alt))
 
     def dbi3_log_parse(self):
         """Function to read and parse a DBI3 log file for later conversion
@@ -129,266 +163,248 @@ class Dbi3Log:
         """
         debug = False
 
-        # Determine unit conversion for additional data fields
-        # Allow additional data fields to be english or metric
-        if not self.kml_cfg.kml_use_metric:
-            temp_is_f = True  # False=centegrade
-            alt_is_ft = True  # False=meters
-            spd_is_mph = True  # False=kph
-            roc_is_fps = True  # False=meters per second
-        else:
-            temp_is_f = False
-            roc_is_fps = False
-            spd_is_mph = False
-            alt_is_ft = False
-
-        # After fw ver 1.2, the log added GPS Altitude.  Check the first data record
-        # to determine if we have it.
-        has_msl = None
-
-        MISSING_TOPT_F = 100.0  # when TOPT is missing, we display this default data
-        MISSING_TOPT_C = 40.0  # - or this
-
-        log_state = 1  # 1=expecting start line, 2=records
-        with open(self.filename) as myfile:
+        # The additional data fields are collected as raw strings, one list per field, and
+        # converted a whole column at a time after the records are read.
+        ambt_col = []
+        bar_col = []
+        topt_col = []  # None where TOPT is not valid
+        sog_col = []
+        cog_col = []
+        roc_col = []
+        batm_col = []
+        brdt_col = []
+        msl_col = []  # None where the record has no GPS altitude
+
+        ddmm2d = self.__ddmm2d  # called twice per data record
+        summary_only = self.summary_only
+        # Start/end time trim window, unbounded where not set
+        trim_start = self.kml_cfg.trim_start_time
+        if trim_start is None:
+            trim_start = datetime.min.replace(tzinfo=utc)
+        trim_end = self.kml_cfg.trim_end_time
+        if trim_end is None:
+            trim_end = datetime.max.replace(tzinfo=utc)
+        # The per-record appends and counters use locals, the counters and first/last GPS record
+        # times are stored after the loop.
+        lat_append = self.kml_lat.append
+        lon_append = self.kml_lon.append
+        alt_append = self.kml_coord_alt.append
+        when_append = self.kml_when.append
+        total_recs = 0
+        data_recs = 0
+        trim_recs = 0
+        bad_recs = 0
+        start_time = None  # time of the first and last GPS data record
+        end_time = None
+        log_state = 1  # 1=expecting start line, 2=records, 3=end line
+        # The log is plain ASCII, a single-byte decode is cheapest and never fails on a stray
+        # corrupt byte, which then shows up as a bad record.
+        with open(self.filename, encoding="latin-1") as myfile:
             rec_time = None
-            # calculate elapsed distance by summing distance between last and current point
-            last_lat = None
-            last_lon = None
-            for line in myfile:
-                self.total_log_recs += 1
-                logvars = {}
-                try:
+            for total_recs, line in enumerate(myfile, 1):
+                # DATA records in the usual layout are split by a single regex match, any other
+                # record is parsed into a dictionary of NAME=VALUE fields.  The regex "$" also
+                # matches before the line's newline, only the dictionary parse strips it.
+                m = _DATA_RE.match(line) if log_state == 2 else None
+                if m is None:
                     line = line.rstrip("\r\n")
-                    arg_pairs = line.split(" ")
-                    for p in arg_pairs:  # type: str
-                        var, val = p.split("=")  # type: (str, str)
-                        logvars[var] = val
-                except Exception as e:
-                    print("Exception parsing line {} is: {}".format(line, e))
-                    self.bad_recs += 1
-                    continue
-
-                if "DATE" in list(logvars.keys()):
-                    # datetime from a start or end line
-                    log_datetime = datetime.strptime(
-                        logvars["DATE"] + " " + logvars["TIME"], "%Y-%m-%d %H:%M:%S"
-                    ).replace(tzinfo=utc)
-                else:
-                    log_datetime = None
-
-                if log_state == 1:  # Expecting the start line from the log file
-                    missing_key = self.__field_check(START_FIELDS, logvars)
-                    if missing_key is not None:
-                        print("Start record missing field " + missing_key)
-                        break
-                    start_datetime = log_datetime
-                    # rec_time is incremented at the BEGINNING of each data loop, so initially decrement here.
-                    rec_time = log_datetime - TWO_SECONDS
-                    self.dbi3_fwver = logvars["FWVER"]
-                    # fw ver 1.2 had a dummy SN in the log header so we override by extracting from the
-                    # DBI3 serial cli, but if that wasn't supplied then use the log field.
-                    if self.dbi3_sn is None:
-                        self.dbi3_sn = logvars["SN"]
-                    log_state = 2
-                    self.proc_log += "  Start time " + start_datetime.strftime(UTC_FMT)
-                elif log_state > 1 and log_datetime is not None:
-                    # START record was processed, the next record with a DATE is the END record
-                    end_datetime = log_datetime
-                    missing_key = self.__field_check(END_FIELDS, logvars)
-                    if missing_key is None:
-                        log_state = 3
-                        if self.kml_start_time is not None:
-                            self.proc_log += " --First GPS record " + self.kml_start_time.strftime(
-                                UTC_FMT
-                            )
-                        self.proc_log += "\n  Total records={}  data records={}  trim records={}  bad records={}".format(
-                            self.total_log_recs, self.data_recs, self.trim_recs, self.bad_recs
+                    logvars = {}
+                    try:
+                        arg_pairs = line.split(" ")
+                        for p in arg_pairs:  # type: str
+                            var, val = p.split("=")  # type: (str, str)
+                            logvars[var] = val
+                    except Exception as e:
+                        print("Exception parsing line {} is: {}".format(line, e))
+                        bad_recs += 1
+                        continue
+
+                    if "DATE" in logvars:
+                        # datetime from a start or end line, YYYY-MM-DD HH:MM:SS
+                        d = logvars["DATE"]
+                        t = logvars["TIME"]
+                        log_datetime = datetime(
+                            int(d[0:4]),
+                            int(d[5:7]),
+                            int(d[8:10]),
+                            int(t[0:2]),
+                            int(t[3:5]),
+                            int(t[6:8]),
+                            tzinfo=utc,
                         )
-                        self.proc_log += "\n  End time " + end_datetime.strftime(UTC_FMT)
-                        if self.kml_end_time is not None:
-                            self.proc_log += " --Last GPS record " + self.kml_end_time.strftime(
-                                UTC_FMT
-                            )
                     else:
-                        print("End record missing field " + missing_key)
-                    break
-                else:
-                    # This should be a DATA record
-                    rec_time += TWO_SECONDS
-                    missing_key = self.__field_check(DATA_FIELDS, logvars)
-                    if missing_key is None:
-                        if logvars["GPSS"] == "0":
-                            ####
-                            # This is a data record and it has GPS data
-                            ####
-                            # Check for start/end time trim
-                            if (
-                                self.kml_cfg.trim_start_time is not None
-                                and rec_time < self.kml_cfg.trim_start_time
-                            ):
-                                self.trim_recs += 1
-                                continue
-                            elif (
-                                self.kml_cfg.trim_end_time is not None
-                                and rec_time > self.kml_cfg.trim_end_time
-                            ):
-                                self.trim_recs += 1
-                                continue
+                        log_datetime = None
 
-                            self.data_recs += 1
+                    if log_state == 1:  # Expecting the start line from the log file
+                        missing_key = self.__field_check(START_FIELDS, logvars)
+                        if missing_key is not None:
+                            print("Start record missing field " + missing_key)
+                            break
+                        start_datetime = log_datetime
+                        # rec_time is incremented at the BEGINNING of each data loop, so initially
+                        # decrement here.
+                        rec_time = log_datetime - TWO_SECONDS
+                        self.dbi3_fwver = logvars["FWVER"]
+                        # fw ver 1.2 had a dummy SN in the log header so we override by extracting from
+                        # the DBI3 serial cli, but if that wasn't supplied then use the log field.
+                        if self.dbi3_sn is None:
+                            self.dbi3_sn = logvars["SN"]
+                        log_state = 2
+                        self.proc_log += "  Start time " + start_datetime.strftime(UTC_FMT)
+                        continue
+                    elif log_datetime is not None:
+                        # START record was processed, the next record with a DATE is the END record
+                        end_datetime = log_datetime
+                        missing_key = self.__field_check(END_FIELDS, logvars)
+                        if missing_key is None:
+                            log_state = 3
+                        else:
+                            print("End record missing field " + missing_key)
+                        break
 
-                            if debug:
-                                print(
-                                    "Record "
-                                    + rec_time.isoformat("T")
-                                    + " "
-                                    + logvars["LAT"]
-                                    + " "
-                                    + logvars["LONG"]
-                                )
+                # This should be a DATA record
+                rec_time += TWO_SECONDS
+                if m is not None:
+                    rec = m.groups()
+                else:
+                    # The fields are fetched in DATA_FIELDS order, the first missing one raises.
+                    try:
+                        rec = _get_data_fields(logvars) + (
+                            logvars.get("BAR"),
+                            logvars.get("MSLALT"),
+                        )
+                    except KeyError as e:
+                        print("Data record missing field " + e.args[0])
+                        bad_recs += 1
+                        continue
+                (
+                    alt_s,
+                    roc_s,
+                    ambt_s,
+                    gpss,
+                    sog_s,
+                    cog_s,
+                    lon_s,
+                    lat_s,
+                    topts,
+                    topt_s,
+                    batm_s,
+                    brdt_s,
+                    bar_s,
+                    msl_s,
+                ) = rec
+                if gpss != "0":
+                    continue
 
-                            # calculate and accumulate KML data
-                            latitude = self.__ddmm2d(logvars["LAT"])
-                            self.kml_lat.append(latitude)
-                            longitude = self.__ddmm2d(logvars["LONG"])
-                            self.kml_lon.append(longitude)
-                            # calculate min/max lat and lon so we can construct a display bounding box
-                            self.min_lat = min(self.min_lat, latitude)
-                            self.max_lat = max(self.max_lat, latitude)
-                            self.min_lon = min(self.min_lon, longitude)
-                            self.max_lon = max(self.max_lon, longitude)
-                            # Append the time and coordinate lists
-                            self.kml_when.append(rec_time.isoformat("T"))
-
-                            altitude = float(logvars["ALT"])
-                            if self.kml_cfg.altitude_offset is not None:
-                                altitude += self.kml_cfg.altitude_offset
-                            self.kml_alt.append(
-                                round(
-                                    altitude
-                                    if self.kml_cfg.kml_use_metric
-                                    else conv_M_to_ft(altitude),
-                                    1,
-                                )
-                            )
-
-                            # if we have GPS altitude available, determine which we use in the coordinates
-                            if (
-                                has_msl is None
-                            ):  # determine if the data record includes GPS altitude
-                                has_msl = logvars.get("MSLALT") is not None
-                                # determine if we have and prefer GPS altitude for the track points
-                                self.kml_coord_alt_gps = has_msl and self.kml_cfg.prefer_gps
-                            if has_msl:
-                                gps_msl = float(logvars["MSLALT"])
-                                self.max_gps_msl = (
-                                    gps_msl
-                                    if self.max_gps_msl is None or gps_msl > self.max_gps_msl
-                                    else self.max_gps_msl
-                                )
-                                self.min_gps_msl = (
-                                    gps_msl
-                                    if self.min_gps_msl is None or gps_msl < self.min_gps_msl
-                                    else self.min_gps_msl
-                                )
-                                self.kml_gps_msl.append(
-                                    round(
-                                        gps_msl
-                                        if self.kml_cfg.kml_use_metric
-                                        else conv_M_to_ft(gps_msl),
-                                        1,
-                                    )
-                                )
+                ####
+                # This is a data record and it has GPS data
+                ####
+                # Check for start/end time trim
+                if not trim_start <= rec_time <= trim_end:
+                    trim_recs += 1
+                    continue
 
-                            # Select the correct pressure/GPS altitude for coordinates
-                            coord_alt = gps_msl if self.kml_coord_alt_gps else altitude
-
-                            self.max_altitude = (
-                                coord_alt
-                                if self.max_altitude is None or coord_alt > self.max_altitude
-                                else self.max_altitude
-                            )
-                            self.min_altitude = (
-                                coord_alt
-                                if self.min_altitude is None or coord_alt < self.min_altitude
-                                else self.min_altitude
-                            )
-
-                            # KML coordinate tuple
-                            self.kml_coord.append((longitude, latitude, coord_alt))
-
-                            #
-                            # For trip stats, sum the total distance traveled, max speed, min/max altitude
-                            #
-                            if last_lat is not None:
-                                point_dist = calc_distance(
-                                    (last_lat, last_lon), (latitude, longitude)
-                                )
-                                self.elapsed_dist += point_dist
-                                # fixed time between points is 2 seconds
-                                computed_sog = point_dist / 2.0
-                                self.max_computed_sog = max(self.max_computed_sog, computed_sog)
-                            last_lat = (
-                                latitude  # save last lat/lon for the next time thru the loop
-                            )
-                            last_lon = longitude
-
-                            #
-                            # Additional data fields
-
-                            # Round floating point data to a reasonable accuracy (e.g. 1 or 2 digit)
-                            #
-                            amb_temp = (
-                                conv_C_to_F(float(logvars["AMBT"]))
-                                if temp_is_f
-                                else float(logvars["AMBT"])
-                            )
-                            self.kml_a_temp.append(round(amb_temp, 1))
-
-                            self.kml_bar.append(round(float(logvars["BAR"]), 2))
-
-                            if logvars["TOPTS"] == "1":  # Top temp value is valid
-                                top_temp = (
-                                    conv_C_to_F(float(logvars["TOPT"]))
-                                    if temp_is_f
-                                    else float(logvars["TOPT"])
-                                )
-                            else:  # Top temp value is missing
-                                top_temp = MISSING_TOPT_F if temp_is_f else MISSING_TOPT_C
-                            self.kml_t_temp.append(round(top_temp, 1))
-
-                            self.kml_diff_t.append(round(top_temp - amb_temp, 1))
-
-                            sog = float(logvars["SOG"])
-                            self.max_sog = max(self.max_sog, sog)
-                            sog = round(conv_M_to_mi(sog * 60 * 60) if spd_is_mph else sog, 1)
-                            self.kml_sog.append(sog)
-
-                            self.kml_cog.append(round(float(logvars["COG"]), 1))
-
-                            roc = float(logvars["ROC"])
-                            roc = round(conv_M_to_ft(roc * 60) if roc_is_fps else roc, 1)
-                            self.kml_roc.append(roc)
-
-                            self.kml_batm.append(round(float(logvars["BATM"]), 2))
-
-                            brdt = float(logvars["BRDT"])
-                            brdt = round(conv_C_to_F(brdt) if temp_is_f else brdt, 2)
-                            self.kml_brdt.append(brdt)
-                            # Finished a valid data record, capture the first time as kml_start,
-                            # update kml_end on each valid data record so we have the last time.
-                            if self.kml_start_time is None:
-                                self.kml_start_time = rec_time
-                                self.kml_start_lat = latitude
-                                self.kml_start_lon = longitude
-                            self.kml_end_time = rec_time
-                    else:
-                        print("Data record missing field " + missing_key)
-                        self.bad_recs += 1
-                    # Do we increment the time before or after the data records?
-            self.kml_end_lat = last_lat
-            self.kml_end_lon = last_lon
+                data_recs += 1
+
+                if debug:
+                    print("Record " + rec_time.isoformat("T") + " " + lat_s + " " + lon_s)
+
+                # calculate and accumulate KML data
+                lat_append(ddmm2d(lat_s))
+                lon_append(ddmm2d(lon_s))
+
+                # KML coordinate altitude, see kml_coord.  The altitude offset is applied after
+                # the loop, and it is replaced by GPS altitude if available and preferred.
+                alt_append(float(alt_s))
+                msl_col.append(msl_s)
+
+                if not summary_only:
+                    # Append the time list
+                    when_append(rec_time.isoformat("T"))
+                    # Additional data fields
+                    ambt_col.append(ambt_s)
+                    bar_col.append(bar_s)
+                    topt_col.append(topt_s if topts == "1" else None)
+                    sog_col.append(sog_s)
+                    cog_col.append(cog_s)
+                    roc_col.append(roc_s)
+                    batm_col.append(batm_s)
+                    brdt_col.append(brdt_s)
+
+                # Finished a valid data record, capture the first time as start_time,
+                # update end_time on each valid data record so we have the last time.
+                if start_time is None:
+                    start_time = rec_time
+                end_time = rec_time
+
+            self.total_log_recs = total_recs
+            self.data_recs = data_recs
+            self.trim_recs = trim_recs
+            self.bad_recs = bad_recs
+            self.kml_start_time = start_time
+            self.kml_end_time = end_time
+            if log_state == 3:
+                if self.kml_start_time is not None:
+                    self.proc_log += " --First GPS record " + self.kml_start_time.strftime(UTC_FMT)
+                self.proc_log += "\n  Total records={}  data records={}  trim records={}  bad records={}".format(
+                    self.total_log_recs, self.data_recs, self.trim_recs, self.bad_recs
+                )
+                self.proc_log += "\n  End time " + end_datetime.strftime(UTC_FMT)
+                if self.kml_end_time is not None:
+                    self.proc_log += " --Last GPS record " + self.kml_end_time.strftime(UTC_FMT)
+
+            # The additional data field columns are converted when an output needs them, see
+            # convert_data_fields()
+            if not summary_only:
+                self.data_field_cols = (
+                    ambt_col,
+                    bar_col,
+                    topt_col,
+                    sog_col,
+                    cog_col,
+                    roc_col,
+                    batm_col,
+                    brdt_col,
+                )
+
+            if self.kml_cfg.altitude_offset is not None:
+                offset = self.kml_cfg.altitude_offset
+                self.kml_coord_alt = array("d", [alt + offset for alt in self.kml_coord_alt])
+            if not summary_only:
+                self.kml_alt = _convert_alt_column(self.kml_coord_alt, self.kml_cfg.kml_use_metric)
+
+            # After fw ver 1.2, the log added GPS Altitude.  The first data record determines
+            # if we have it.
+            if msl_col and msl_col[0] is not None:
+                gps_msl_col = array("d", [float(msl) for msl in msl_col])
+                if not summary_only:
+                    self.kml_gps_msl = _convert_alt_column(
+                        gps_msl_col, self.kml_cfg.kml_use_metric
+                    )
+                self.min_gps_msl = min(gps_msl_col)
+                self.max_gps_msl = max(gps_msl_col)
+                # determine if we prefer GPS altitude for the track points
+                self.kml_coord_alt_gps = self.kml_cfg.prefer_gps
+                if self.kml_coord_alt_gps:
+                    self.kml_coord_alt = gps_msl_col
+
+            if self.kml_lat:
+                self.kml_start_lat = self.kml_lat[0]
+                self.kml_start_lon = self.kml_lon[0]
+                self.kml_end_lat = self.kml_lat[-1]
+                self.kml_end_lon = self.kml_lon[-1]
+                # min/max lat and lon so we can construct a display bounding box
+                self.min_lat = min(self.min_lat, min(self.kml_lat))
+                self.max_lat = max(self.max_lat, max(self.kml_lat))
+                self.min_lon = min(self.min_lon, min(self.kml_lon))
+                self.max_lon = max(self.max_lon, max(self.kml_lon))
+                self.min_altitude = min(self.kml_coord_alt)
+                self.max_altitude = max(self.kml_coord_alt)
+            # For trip stats, sum the total distance traveled and max speed over the whole track
+            if not summary_only:
+                self.elapsed_dist, self.max_computed_sog = _track_distance(
+                    self.kml_lat, self.kml_lon
+                )
 
             rtn_val = self.data_recs if log_state == 3 else -1
 
@@ -400,6 +416,29 @@ class Dbi3Log:
                 max_altitude=self.max_altitude,
             )
 
+    def convert_data_fields(self):
+        """Convert the raw additional data field columns from the parse to KML data values.
+
+        Converting and rounding every value is a large part of the log processing and a parsed
+        log is not always output, so it is done on the first call only.
+        """
+        if self.data_field_cols is None:
+            return
+        (
+            self.kml_a_temp,
+            self.kml_bar,
+            self.kml_t_temp,
+            self.kml_diff_t,
+            self.kml_sog,
+            self.kml_cog,
+            self.kml_roc,
+            self.kml_batm,
+            self.kml_brdt,
+            max_sog,
+        ) = _convert_data_columns(*self.data_field_cols, self.kml_cfg.kml_use_metric)
+        self.max_sog = max(self.max_sog, max_sog)
+        self.data_field_cols = None
+
     @staticmethod
     def __field_check(req_fields, myvars):
         """Check that all required data fields exists.
@@ -435,14 +474,11 @@ class Dbi3Log:
         Return:
             floating point degrees equivelent of dm
         """
-        hemi = dm[-1:]
-        dm = dm[:-1]
-        min_dec = dm.find(".")
-        deg = dm[: min_dec - 2]
-        minutes = dm[min_dec - 2 :]
-        latlon = float(deg) + float(minutes) / 60.0
-        if hemi == "W" or hemi == "S":
-            latlon = 0.0 - latlon
+        # minutes start 2 digits before the decimal point, the hemisphere is the last character
+        min_start = dm.find(".") - 2
+        latlon = float(dm[:min_start]) + float(dm[min_start:-1]) / 60.0
+        if dm[-1:] in ("W", "S"):
+            return 0.0 - latlon
         return latlon
 
 
@@ -453,13 +489,14 @@ class Dbi3LogConversion:
     Parse the DBI3 log file, then provide methods to output various conversion formats.
     """
 
-    def __init__(self, filename, config, altitude_offset=None):
+    def __init__(self, filename, config, altitude_offset=None, summary_only=False):
         """
         Initialize the config object, parse the log file.
 
         :param filename: DBI3 log filename
         :param Dbi3ConfigOptions config:  Application options object
         :param float altitude_offset:  For single file conversion, optional alt offset in meters.
+        :param bool summary_only:  Only parse for log_summary(), the log can not be converted.
         """
 
         self.filename = filename
@@ -469,7 +506,8 @@ class Dbi3LogConversion:
         if self.app_config.verbose:
             print("Dbi3LogConversion - kml_cfg - {}".format(self.kml_cfg))
 
-        self.dbi3_log = Dbi3Log(self.kml_cfg, self.filename)  # Log object for a specific DBI3 log
+        # Log object for a specific DBI3 log
+        self.dbi3_log = Dbi3Log(self.kml_cfg, self.filename, summary_only=summary_only)
         self.parse_summary = self.dbi3_log.dbi3_log_parse()
 
     def log_summary(self):
@@ -505,11 +543,15 @@ class Dbi3LogConversion:
             alt_is_ft = False
 
         # check the status of the log_parse()
-        if self.dbi3_log.data_recs == 0:
+        if self.dbi3_log.summary_only:
+            return -1, "Log parsed for a summary only, skip conversion"
+        elif self.dbi3_log.data_recs == 0:
             return 1, "No GPS data records, skip KML file generations"
         elif self.dbi3_log.data_recs < 0:
             return -1, "No END record, skip KML file generation"
 
+        self.dbi3_log.convert_data_fields()
+
         # fw ver 1.3 added GPS altitude.  If we have both we use the preferred (pressure/GPS)
         # altitude in the track points and add the other as an additional data field.
         add_pressure_alt = False
@@ -584,6 +626,9 @@ class Dbi3LogConversion:
 
         #
         # Moving on to KML generation
+        # simplekml is only needed here, it is imported on first use to keep the module import
+        # (log listing and summaries) light.
+        from simplekml import Kml, Types
 
         # Create the KML document
         kml = Kml(
@@ -669,9 +714,18 @@ class Dbi3LogConversion:
         #
         # Add all the information to the track
         #
-        # Each item in the give nlist will become a new <when> tag
-        trk.newwhen(self.dbi3_log.kml_when)
-        trk.newgxcoord(self.dbi3_log.kml_coord)
+        # The track data is added as one placeholder per element list and written out by
+        # _save_kml(), each item of the data becomes a new <when>, <gx:coord> or <gx:value> tag.
+        # The <gx:coord> tags follow the <when> tags in a track.
+        track_data = {
+            "DBI3_WHEN": (
+                # kml_when holds the ISO strings formatted during the parse, so plain
+                # concatenation is enough here
+                ["<when>" + when + "</when>" for when in self.dbi3_log.kml_when]
+                + ["<gx:coord>{} {} {}</gx:coord>".format(*crd) for crd in self.dbi3_log.kml_coord]
+            )
+        }
+        trk.newwhen("DBI3_WHEN")
 
         # Add points to the start and end of the track
         pnt = fol.newpoint(
@@ -692,26 +746,34 @@ class Dbi3LogConversion:
         )
 
         # Add any additional data fields that are requested
+        array_data = []
         if add_gps_alt:
-            trk.extendeddata.schemadata.newgxsimplearraydata("g_alt", self.dbi3_log.kml_gps_msl)
+            array_data.append(("g_alt", self.dbi3_log.kml_gps_msl))
         if add_pressure_alt:
-            trk.extendeddata.schemadata.newgxsimplearraydata("p_alt", self.dbi3_log.kml_alt)
+            array_data.append(("p_alt", self.dbi3_log.kml_alt))
         if "AMBT" in self.kml_cfg.kml_fields:
-            trk.extendeddata.schemadata.newgxsimplearraydata("a_temp", self.dbi3_log.kml_a_temp)
+            array_data.append(("a_temp", self.dbi3_log.kml_a_temp))
         if "TOPT" in self.kml_cfg.kml_fields:
-            trk.extendeddata.schemadata.newgxsimplearraydata("t_temp", self.dbi3_log.kml_t_temp)
+            array_data.append(("t_temp", self.dbi3_log.kml_t_temp))
         if "DIFF" in self.kml_cfg.kml_fields:
-            trk.extendeddata.schemadata.newgxsimplearraydata("d_temp", self.dbi3_log.kml_diff_t)
+            array_data.append(("d_temp", self.dbi3_log.kml_diff_t))
         if "COG" in self.kml_cfg.kml_fields:
-            trk.extendeddata.schemadata.newgxsimplearraydata("cog", self.dbi3_log.kml_cog)
+            array_data.append(("cog", self.dbi3_log.kml_cog))
         if "SOG" in self.kml_cfg.kml_fields:
-            trk.extendeddata.schemadata.newgxsimplearraydata("sog", self.dbi3_log.kml_sog)
+            array_data.append(("sog", self.dbi3_log.kml_sog))
         if "ROC" in self.kml_cfg.kml_fields:
-            trk.extendeddata.schemadata.newgxsimplearraydata("roc", self.dbi3_log.kml_roc)
+            array_data.append(("roc", self.dbi3_log.kml_roc))
         if "BATM" in self.kml_cfg.kml_fields:
-            trk.extendeddata.schemadata.newgxsimplearraydata("batm", self.dbi3_log.kml_batm)
+            array_data.append(("batm", self.dbi3_log.kml_batm))
         if "BRDT" in self.kml_cfg.kml_fields:
-            trk.extendeddata.schemadata.newgxsimplearraydata("brdt", self.dbi3_log.kml_brdt)
+            array_data.append(("brdt", self.dbi3_log.kml_brdt))
+        array_fields = []  # simplekml data object of each array_data entry
+        for name, values in array_data:
+            placeholder = "DBI3_DATA_" + name
+            track_data[placeholder] = ["<gx:value>{}</gx:value>".format(v) for v in values]
+            array_fields.append(
+                trk.extendeddata.schemadata.newgxsimplearraydata(name, [placeholder])
+            )
 
         # Styling
         trk.stylemap.normalstyle.iconstyle.icon.href = (
@@ -727,7 +789,14 @@ class Dbi3LogConversion:
         trk.stylemap.highlightstyle.linestyle.width = 8
 
         # Save the kml to file
-        kml.save(base_name + ".kml")
+        if not _save_kml(kml, base_name + ".kml", track_data):
+            # The placeholder layout wasn't recognized, fill in the track data and let simplekml
+            # write the full document
+            trk.whens = list(self.dbi3_log.kml_when)
+            trk.newgxcoord(list(self.dbi3_log.kml_coord))
+            for field, (name, values) in zip(array_fields, array_data):
+                field.values = list(values)
+            kml.save(base_name + ".kml")
 
         return 0, self.dbi3_log.proc_log
 
@@ -737,54 +806,93 @@ class Dbi3LogConversion:
 
         Should adapt column header to metric/imperial
 
+        A csv_filename ending in .feather or .parquet writes the same columns in that format
+        instead, this needs the optional pyarrow package.
+
         :param str csv_filename:
         :returns:
             - status(int):    status
             - proc_log(str):  detail log of processing
         """
+        log = self.dbi3_log
         # check the status of the log_parse()
-        if self.dbi3_log.data_recs == 0:
+        if log.summary_only:
+            return -1, "Log parsed for a summary only, skip conversion"
+        elif log.data_recs == 0:
             return 1, "No GPS data records, skip KML file generations"
-        elif self.dbi3_log.data_recs < 0:
+        elif log.data_recs < 0:
             return -1, "No END record, skip KML file generation"
 
-        with open(csv_filename, "w") as csv_file:
-            if len(self.dbi3_log.kml_gps_msl) > 0:
-                print("timestamp,alt,gps_alt,lat,lon,head,speed,bar,temp,diff_temp", file=csv_file)
-
-                for t_pnt in zip(
-                    self.dbi3_log.kml_when,
-                    self.dbi3_log.kml_alt,
-                    self.dbi3_log.kml_gps_msl,
-                    self.dbi3_log.kml_lat,
-                    self.dbi3_log.kml_lon,
-                    self.dbi3_log.kml_cog,
-                    self.dbi3_log.kml_sog,
-                    self.dbi3_log.kml_bar,
-                    self.dbi3_log.kml_a_temp,
-                    self.dbi3_log.kml_diff_t,
-                ):
-                    print("{},{},{},{},{},{},{},{},{},{}".format(*t_pnt), file=csv_file)
+        log.convert_data_fields()
 
-            else:
-                print("timestamp,alt,lat,lon,head,speed,bar,temp,diff_temp", file=csv_file)
-
-                for t_pnt in zip(
-                    self.dbi3_log.kml_when,
-                    self.dbi3_log.kml_alt,
-                    self.dbi3_log.kml_lat,
-                    self.dbi3_log.kml_lon,
-                    self.dbi3_log.kml_cog,
-                    self.dbi3_log.kml_sog,
-                    self.dbi3_log.kml_bar,
-                    self.dbi3_log.kml_a_temp,
-                    self.dbi3_log.kml_diff_t,
-                ):
-                    print("{},{},{},{},{},{},{},{},{}".format(*t_pnt), file=csv_file)
+        if len(log.kml_gps_msl) > 0:
+            header = "timestamp,alt,gps_alt,lat,lon,head,speed,bar,temp,diff_temp"
+            columns = (log.kml_alt, log.kml_gps_msl, log.kml_lat, log.kml_lon)
+        else:
+            header = "timestamp,alt,lat,lon,head,speed,bar,temp,diff_temp"
+            columns = (log.kml_alt, log.kml_lat, log.kml_lon)
+        columns += (log.kml_cog, log.kml_sog, log.kml_bar, log.kml_a_temp, log.kml_diff_t)
+
+        if csv_filename.endswith((".feather", ".parquet")):
+            try:
+                _write_arrow_table(csv_filename, header.split(","), (log.kml_when,) + columns)
+            except ImportError:
+                return -1, "pyarrow is not installed, skip {} generation".format(
+                    os.path.splitext(csv_filename)[1]
+                )
+            return 0, "  Arrow Write {} complete".format(os.path.basename(csv_filename))
+
+        # Columns are kept as they are stored, each one is lazily turned into strings by map()
+        # and the rows are joined from the string columns.  The columns are float arrays, so
+        # the builtin repr() gives the same text as str() without the call through the str type.
+        csv_rows = map(",".join, zip(log.kml_when, *[map(repr, column) for column in columns]))
+
+        # Written as bytes with the platform line ending, as text mode would, without the extra
+        # newline translation and encoding pass of a text file.  Rows are formatted and written
+        # in bounded batches so a long log never holds the whole CSV text in memory.
+        linesep = os.linesep
+        join_lines = linesep.join
+        with open(csv_filename, "wb") as csv_file:
+            write = csv_file.write
+            write((header + linesep).encode("utf-8"))
+            while True:
+                csv_lines = list(islice(csv_rows, _CSV_BATCH_ROWS))
+                if not csv_lines:
+                    break
+                csv_lines.append("")  # newline after the last line of the batch
+                write(join_lines(csv_lines).encode("utf-8"))
 
         return 0, "  CSV Write {} complete".format(os.path.basename(csv_filename))
 
 
+def _write_arrow_table(filename, names, columns):
+    """Write the CSV columns as a Feather or Parquet file, picked by the filename extension.
+
+    Columnar and compressed, these are much smaller and faster to write and load than CSV for
+    long logs.  pyarrow is only imported here so it stays an optional dependency.
+
+    :param str filename: Full path to the .feather or .parquet output
+    :param list,str names: column names, the CSV header fields
+    :param tuple columns: timestamp strings followed by the numeric data columns
+    :raises ImportError: pyarrow is not installed
+    """
+    import pyarrow
+
+    table = pyarrow.table(
+        [pyarrow.array(columns[0], pyarrow.string())]
+        + [pyarrow.array(column, pyarrow.float64()) for column in columns[1:]],
+        names=names,
+    )
+    if filename.endswith(".parquet"):
+        from pyarrow import parquet
+
+        parquet.write_table(table, filename, compression="zstd")
+    else:
+        from pyarrow import feather
+
+        feather.write_feather(table, filename, compression="zstd")
+
+
 def conv_C_to_F(tempC):
     """Convert Centigrade to Fahrenheit."""
     return 9.0 / 5.0 * tempC + 32
@@ -792,17 +900,161 @@ def conv_C_to_F(tempC):
 
 def conv_M_to_ft(meters):
     """Convert Meters to feet."""
-    return meters * 3.28084
+    return meters * M_TO_FT
 
 
 def conv_ft_to_M(feet):
     """Convert feet to Meters."""
-    return feet / 3.28084
+    return feet / M_TO_FT
 
 
 def conv_M_to_mi(meters):
     """Convert Meters to miles."""
-    return meters * 0.000621371
+    return meters * M_TO_MI
+
+
+def _convert_data_columns(
+    ambt_col, bar_col, topt_col, sog_col, cog_col, roc_col, batm_col, brdt_col, use_metric
+):
+    """Convert the raw additional data field columns of a log to KML data values.
+
+    Each column is converted in one pass, the unit selection is made once per column.  The
+    unit conversions are written out in the comprehensions, the same arithmetic as the conv_*
+    functions without a function call per value.
+    Floating point data is rounded to a reasonable accuracy (e.g. 1 or 2 digit).
+
+    :param list,str ambt_col: AMBT values, Celsius
+    :param list,str bar_col: BAR values, hecto Pascal
+    :param list,str topt_col: TOPT values, Celsius, None where TOPTS flags it missing
+    :param list,str sog_col: SOG values, M/s
+    :param list,str cog_col: COG values, degrees
+    :param list,str roc_col: ROC values, M/s
+    :param list,str batm_col: BATM values, Volts
+    :param list,str brdt_col: BRDT values, Celsius
+    :param bool use_metric: metric or imperial (F, MPH, FPM) output units
+    :return tuple: arrays of ambient temp, bar, top temp, diff temp, sog, cog, roc, batm,
+        brdt values and the max SOG in M/s (0.0 for no records)
+    """
+    amb_temps = list(map(float, ambt_col))
+    if not use_metric:
+        amb_temps = [9.0 / 5.0 * t + 32 for t in amb_temps]
+    missing_topt = MISSING_TOPT_C if use_metric else MISSING_TOPT_F
+    top_temps = [
+        missing_topt if t is None else float(t) if use_metric else 9.0 / 5.0 * float(t) + 32
+        for t in topt_col
+    ]
+    a_temp = array("d", [round(t, 1) for t in amb_temps])
+    bar = array("d", [round(b, 2) for b in map(float, bar_col)])
+    t_temp = array("d", [round(t, 1) for t in top_temps])
+    diff_t = array("d", [round(t - a, 1) for t, a in zip(top_temps, amb_temps)])
+
+    sogs = list(map(float, sog_col))
+    max_sog = max(sogs, default=0.0)
+    if use_metric:
+        sog = array("d", [round(v, 1) for v in sogs])
+    else:
+        sog = array("d", [round(v * 60 * 60 * M_TO_MI, 1) for v in sogs])
+
+    cog = array("d", [round(v, 1) for v in map(float, cog_col)])
+
+    if use_metric:
+        roc = array("d", [round(v, 1) for v in map(float, roc_col)])
+    else:
+        roc = array("d", [round(v * 60 * M_TO_FT, 1) for v in map(float, roc_col)])
+
+    batm = array("d", [round(v, 2) for v in map(float, batm_col)])
+
+    if use_metric:
+        brdt = array("d", [round(v, 2) for v in map(float, brdt_col)])
+    else:
+        brdt = array("d", [round(9.0 / 5.0 * v + 32, 2) for v in map(float, brdt_col)])
+
+    return a_temp, bar, t_temp, diff_t, sog, cog, roc, batm, brdt, max_sog
+
+
+def _save_kml(kml, kml_filename, track_data):
+    """Save a KML document, writing the preformatted track data in place of its placeholders.
+
+    simplekml pretty prints the whole document through xml.dom.minidom, which is by far the
+    largest cost of a conversion when it includes every track point.  The document is built
+    with a single placeholder value per list of track data tags, pretty printed, and each
+    placeholder line replaced by the track data tags at the same indentation.  The result is
+    the same file kml.save() writes for the full document.
+
+    This depends on simplekml printing each placeholder as a line of its own, if any
+    placeholder line isn't found nothing is written and the caller has to save the full
+    document instead.
+
+    :param Kml kml: KML document
+    :param str kml_filename: output filename
+    :param dict track_data: placeholder text: list of the tags replacing its line
+    :return bool: True if the KML was written, False if a placeholder line was not found
+    """
+
+    def expand(match):
+        indent = match.group(1)
+        return indent + ("\n" + indent).join(track_data[match.group(3)])
+
+    kml_text, count = _PLACEHOLDER_RE.subn(expand, kml.kml())
+    if count != len(track_data):
+        return False
+    with open(kml_filename, "w", encoding="utf-8", newline="") as kml_file:
+        kml_file.write(kml_text)
+    return True
+
+
+def _convert_alt_column(alts, use_metric):
+    """Convert a column of altitudes to KML data values, rounded to 1 digit.
+
+    :param array,float alts: altitudes in Meters
+    :param bool use_metric: metric or imperial (feet) output units
+    :return array: converted altitudes
+    """
+    if use_metric:
+        return array("d", [round(alt, 1) for alt in alts])
+    return array("d", [round(alt * M_TO_FT, 1) for alt in alts])
+
+
+def _track_distance(lats, lons):
+    """Sum the distance between consecutive track points and find the fastest leg.
+
+    Run once over the parsed coordinate lists rather than per record inside the parse loop.
+
+    :param list,floats lats: decimal latitude of each track point
+    :param list,floats lons: decimal longitude of each track point
+    :return tuple: elapsed distance in Meters, max computed SOG in M/s
+    """
+    legs = calc_track_distances(lats, lons)
+    elapsed_dist = 0.0
+    for leg in legs:
+        elapsed_dist += leg
+    # fixed time between points is 2 seconds
+    return elapsed_dist, max(legs, default=0.0) / 2.0
+
+
+def calc_track_distances(lats, lons):
+    """Give the distance in Meters of each leg between consecutive track points.
+
+    The batch form of calc_distance(), applied to all the legs in one loop without a function
+    call and argument tuples per leg.  Each point is the end of one leg and the start of the
+    next, so the cosine of its latitude is computed once.
+
+    :param list,floats lats: decimal latitude of each track point
+    :param list,floats lons: decimal longitude of each track point
+    :return array: leg distances in Meters, one less than the number of points
+    """
+    diameter = 2 * 6371.0 * 1000.0  # Meters
+    legs = array("d")
+    cos_lats = [cos(lat * DEG_TO_RAD) for lat in lats]
+    for lat1, lat2, lon1, lon2, cos_lat1, cos_lat2 in zip(
+        lats, lats[1:], lons, lons[1:], cos_lats, cos_lats[1:]
+    ):
+        sin_dlat = sin((lat2 - lat1) * DEG_TO_RAD / 2)
+        sin_dlon = sin((lon2 - lon1) * DEG_TO_RAD / 2)
+        a = sin_dlat * sin_dlat + cos_lat1 * cos_lat2 * sin_dlon * sin_dlon
+        # asin(sqrt(a)) equals atan2(sqrt(a), sqrt(1 - a)) for 0 <= a <= 1
+        legs.append(diameter * asin(sqrt(a)))
+    return legs
 
 
 def calc_distance(origin, destination):
@@ -816,17 +1068,52 @@ def calc_distance(origin, destination):
     lat2, lon2 = destination
     radius = 6371.0  # km
 
-    dlat = math.radians(lat2 - lat1)
-    dlon = math.radians(lon2 - lon1)
-    a = math.sin(dlat / 2) * math.sin(dlat / 2) + math.cos(math.radians(lat1)) * math.cos(
-        math.radians(lat2)
-    ) * math.sin(dlon / 2) * math.sin(dlon / 2)
-    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+    sin_dlat = sin((lat2 - lat1) * DEG_TO_RAD / 2)
+    sin_dlon = sin((lon2 - lon1) * DEG_TO_RAD / 2)
+    a = sin_dlat * sin_dlat + cos(lat1 * DEG_TO_RAD) * cos(lat2 * DEG_TO_RAD) * sin_dlon * sin_dlon
+    c = 2 * atan2(sqrt(a), sqrt(1 - a))
     d = radius * c
 
     return d * 1000.0
 
 
+def convert_log(log_filename, kml_filename, config):
+    """Parse and convert a single DBI3 log to KML.
+
+    Module level so it can run in a process pool worker, the config object is pickled
+    across to the worker.
+
+    :param str log_filename: Full path to the DBI3 log file
+    :param str kml_filename: Full path to the KML output, without extension
+    :param Dbi3ConfigOptions config: Application config object
+    :return: int, str - kml_convert status and report string
+    """
+    return Dbi3LogConversion(log_filename, config).kml_convert(kml_filename)
+
+
+def convert_many(conversions, config):
+    """Convert a batch of DBI3 logs to KML across a process pool.
+
+    Each conversion is independent and CPU bound, so the logs are distributed across up to
+    one worker process per CPU.  The workers are spawned, not forked, the caller may already
+    have a spinner thread running.
+
+    :param list conversions: (log filename, KML filename without extension) pairs
+    :param Dbi3ConfigOptions config: Application config object
+    :return list: kml_convert() status and report string of each conversion, in order
+    """
+    if len(conversions) == 0:
+        return []
+    log_filenames, kml_filenames = zip(*conversions)
+    max_workers = min(len(conversions), os.cpu_count() or 1)
+    with ProcessPoolExecutor(
+        max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")
+    ) as pool:
+        return list(
+            pool.map(convert_log, log_filenames, kml_filenames, [config] * len(conversions))
+        )
+
+
 class Dbi3KmlList:
     """Manipulate the list for DBI3 log to KML conversions.
 
@@ -851,25 +1138,31 @@ class Dbi3KmlList:
 
         # To determine "new" KML we need to know the latest KML in kml_path
         dt = None
-        for item in sorted(os.listdir(config.kml_path), reverse=True):
-            if not os.path.isfile(os.path.join(config.kml_path, item)):
-                continue
+        # KML names are fixed width YYYYMMDD_HHMM_<sn>.kml, so the largest name matching our SN
+        # is the newest and only that one needs its date parsed.  The kml could be for another
+        # SN, those names are skipped in the same scandir pass (no stat() per entry).
+        kml_re = re.compile(r"\d{8}_\d{4}_" + re.escape(config.sn) + r"\.kml")
+        with os.scandir(config.kml_path) as entries:
+            kml_names = [
+                entry.name for entry in entries if kml_re.fullmatch(entry.name) and entry.is_file()
+            ]
+        while kml_names:
+            item = max(kml_names)
             try:
-                # This strptime also verifies the filename format
+                # This strptime also verifies the date fields are valid
                 dt = datetime.strptime(item, "%Y%m%d_%H%M_{}.kml".format(config.sn)).replace(
                     tzinfo=utc
                 )
             except ValueError as e:
-                # Could be the kml didn't match our current SN for logs
                 if self.debug:
                     print(("Parse error of {}:{}".format(item, e)))
+                kml_names.remove(item)  # try the next newest
                 continue
-            if dt is not None:
-                # make new_limit timezone aware
-                self.new_limit = dt + timedelta(minutes=1)
-                if config.verbose:
-                    print("DBI3 KML computed new file threshold: {}".format(self.new_limit))
-                break
+            # make new_limit timezone aware
+            self.new_limit = dt + timedelta(minutes=1)
+            if config.verbose:
+                print("DBI3 KML computed new file threshold: {}".format(self.new_limit))
+            break
 
     def refresh_list(self):
         """Builds list of available LOG files and selects those without a corresponding KML conversion.
@@ -892,26 +1185,39 @@ class Dbi3KmlList:
         if dt_limit is not None:
             age_limit_name = dt_limit.strftime("%Y_%m_%d_%H_%M_%S.log")
 
-        # regex to extract timestamp fields from DBI3 log name format
-        prog = re.compile("^(\d{4})_(\d\d)_(\d\d)_(\d\d)_(\d\d)_(\d\d).log$")
-        for log_name in sorted(os.listdir(self.log_sn_path)):
-            name_parts = prog.match(log_name)
-            log_filename = os.path.join(self.log_sn_path, log_name)
+        # One scan of each directory gives every file name, so the log, metadata and KML
+        # existence checks below are set lookups instead of a stat() each
+        with os.scandir(self.log_sn_path) as entries:
+            log_files = {entry.name for entry in entries if entry.is_file()}
+        with os.scandir(self.app_config.kml_path) as entries:
+            kml_files = {entry.name for entry in entries if entry.is_file()}
+        for log_name in sorted(log_files):
+            # The cheap length and suffix tests skip metadata and other files before the regex
             if (
-                name_parts is not None
-                and os.path.isfile(log_filename)
+                len(log_name) == _LOG_NAME_LEN
+                and log_name.endswith(".log")
                 and (age_limit_name is None or log_name > age_limit_name)
+                and _LOG_NAME_RE.fullmatch(log_name)
             ):
                 # log_name matches the re, is a file, and exceeds the age limit if defined
+                log_filename = os.path.join(self.log_sn_path, log_name)
                 selected = False
                 data = None
-                kml_name = name_parts.expand("\\1\\2\\3_\\4\\5_") + self.app_config.sn
+                # fixed width name, YYYY_MM_DD_HH_MM to YYYYMMDD_HHMM_
+                kml_name = "{}{}{}_{}{}_{}".format(
+                    log_name[0:4],
+                    log_name[5:7],
+                    log_name[8:10],
+                    log_name[11:13],
+                    log_name[14:16],
+                    self.app_config.sn,
+                )
                 kml_filename = os.path.join(self.app_config.kml_path, kml_name)
                 # create metadata name from log name
                 log_metaname = os.path.join(self.log_sn_path, "." + log_name[0:-4])
-                if not os.path.isfile(kml_filename + ".kml"):
+                if kml_name + ".kml" not in kml_files:
                     selected = True
-                if os.path.isfile(log_metaname):
+                if "." + log_name[0:-4] in log_files:
                     # meta file data to override some conversion settings
                     try:
                         with open(log_metaname, "r") as meta:
@@ -928,9 +1234,10 @@ class Dbi3KmlList:
                             os.rename(log_metaname, t_nam)
                             break
                         get_log().info(
-                            "Metadata parse error in {} :\n ".format(log_metaname)
-                            + repr(e)
-                            + "\n Renamed to {}".format(t_nam)
+                            "Metadata parse error in %s :\n %r\n Renamed to %s",
+                            log_metaname,
+                            e,
+                            t_nam,
                         )
                         date = None
                 self.conversion_list.append(
@@ -34,10 +34,14 @@ Some DBI3 serial cli commands don't produce an EOF indication (fs list, fs read)
 after the command and use the 'md mach' 'ok/nok' response as the command EOF.
 """
 import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import serial
 from serial.tools.list_ports import comports
 from datetime import datetime, timedelta
+from time import monotonic
 import json
+import re
 
 try:
     from dbi3_common import LogList, utc
@@ -50,6 +54,32 @@ except ImportError:
 
 __version__ = "0.1.alpah1"
 
+# The ok/nok response line that ends a multiline output, see __readDbi3Lines
+_RESP_END_RE = re.compile(rb"^\s*n?ok\s*?$", re.MULTILINE)
+# Downloaded log file name format, YYYY_MM_DD_HH_MM_SS.log
+_LOG_NAME_RE = re.compile(r"\d{4}_\d\d_\d\d_\d\d_\d\d_\d\d\.log")
+# Fixed DBI3 command lines, encoded once.  A trailing md mach ends a multiline output with ok/nok
+_PROLOG_CMD = b"md mach\rfs stop\r"
+_SN_CMD = b"sn\r"
+_FS_LIST_CMD = b"fs list\rmd mach\r"
+# Write buffer size for downloaded log files
+_LOG_WRITE_BUFFER = 64 * 1024
+
+# Radix 26 letters A-Z to the digits int() uses for base 26, 0-9 then a-p
+_RAD26_DIGITS = str.maketrans("ABCDEFGHIJKLMNOPQRSTUVWXYZ", "0123456789abcdefghijklmnop")
+
+
+def _load_metadata(meta_filename):
+    """Load a log conversion metadata file.
+
+    :param str meta_filename: Full path to the metadata file, or None
+    :return dict: the metadata, None without a metadata file
+    """
+    if meta_filename is None:
+        return None
+    with open(meta_filename, "r") as meta:
+        return json.load(meta)
+
 
 class DBI3LogDownload:
     """Class to access DBI3 via serial port.
@@ -104,6 +134,8 @@ class DBI3LogDownload:
         self.cfg_dict = {}  # to hold the current DBI3 config settings
 
         self.readline_buf = bytearray()  # init buffer for our block mode readline
+        self.readline_pos = 0  # start of the unread data in readline_buf
+        self.queued_read = None  # rad26 name of a log read already requested, see get_DBI3_log
         if app_config.log_path is None or not os.path.isdir(app_config.log_path):
             raise IOError("Log file path {} does not exist.".format(app_config.log_path))
         if self.com_port is None:
@@ -128,17 +160,39 @@ class DBI3LogDownload:
         """ DBI3 log names are radix 26 encoded string.  Seven upper case characters
         where each character is a number from 0-26 and converts to a 32bit integer.
 
+        The letters are translated to int() base 26 digits so the conversion is done in C
+        rather than a Python loop per character.
+
         :param str rad26: 7 character log name, Radix 26 encoded
         :return int: Translation of rad26 to integer
+        :raise ValueError: rad26 has characters other than A-Z
         """
-        encoded_int = 0
+        return int(rad26.translate(_RAD26_DIGITS), 26)
 
-        for i in list(rad26):
-            encoded_int = encoded_int * 26
-            encoded_int = encoded_int + (ord(i) - ord("A"))
-        return encoded_int
+    @staticmethod
+    def __fat_fields(rad26):
+        """
+        Decode a 7 character log name into its DOS FAT timestamp fields.
 
-    def __fat_to_datetime(self, rad26):
+        The layout of the fields is described in __fat_to_datetime().
+
+        :param str rad26: 7 character log name, Radix 26 encoded
+        :return tuple,int: year, month, day, hour, minute, second
+        """
+        fat = DBI3LogDownload.__radix26_to_int(rad26)
+        # Each field is shifted and masked straight from the FAT value
+        return (
+            ((fat >> 25) & 0x7F) + 1980,  # year
+            (fat >> 21) & 0xF,  # month
+            (fat >> 16) & 0x1F,  # day
+            (fat >> 11) & 0x1F,  # hour
+            (fat >> 5) & 0x3F,  # minute
+            (fat & 0x1F) * 2,  # second
+        )
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def __fat_to_datetime(rad26):
         """
         Convert 7 character log name to datetime.
 
@@ -157,22 +211,58 @@ class DBI3LogDownload:
         10-5    Minutes (0-59)
         4-0     Seconds/2 (0-29)
 
+        The result only depends on the name and datetime is immutable, so conversions are
+        cached across repeated log listings and the downloads of listed logs.
+
         :param str rad26: 7 character log name, Radix 26 encoded
         :return datetime: Translation of rad26
         """
-        fat = self.__radix26_to_int(rad26)
-        second = (fat & 0x1F) * 2
-        fat >>= 5
-        minute = fat & 0x3F
-        fat >>= 6
-        hour = fat & 0x1F
-        fat >>= 5
-        day = fat & 0x1F
-        fat >>= 5
-        month = fat & 0xF
-        fat >>= 4
-        year = (fat & 0x7F) + 1980
-        return datetime(year, month, day, hour, minute, second, tzinfo=utc)
+        return datetime(*DBI3LogDownload.__fat_fields(rad26), 0, utc)
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def __fat_to_basename(rad26):
+        """
+        Convert 7 character log name to the YYYY_MM_DD_HH_MM_SS log file basename.
+
+        Same fields as __fat_to_datetime(), formatted straight from the FAT bitfields so file
+        names don't need a datetime and strftime.
+
+        :param str rad26: 7 character log name, Radix 26 encoded
+        :return str: log file basename, without extension
+        """
+        return "%04d_%02d_%02d_%02d_%02d_%02d" % DBI3LogDownload.__fat_fields(rad26)
+
+    @staticmethod
+    def __datetime_to_rad26(dt):
+        """Encode a datetime as the first 7 character log name that is not earlier than it.
+
+        The inverse of __fat_to_datetime(), rounded up to the FAT 2 second resolution.  Log
+        names are fixed width radix 26 numbers, so comparing a log name string with the result
+        gives the same order as comparing the log start datetime with dt.
+
+        :param datetime dt: timezone aware datetime
+        :return str: 7 character log name, Radix 26 encoded
+        """
+        dt = dt.astimezone(utc)
+        if dt.year < 1980:
+            return "AAAAAAA"  # before the FAT epoch, every log name is later
+        fat = (
+            (dt.year - 1980) << 25
+            | dt.month << 21
+            | dt.day << 16
+            | dt.hour << 11
+            | dt.minute << 5
+            | dt.second // 2
+        )
+        if dt.second % 2 or dt.microsecond:
+            fat += 1  # round up to the next 2 second step
+        fat = min(fat, 26**7 - 1)
+        rad26 = ""
+        for _ in range(7):
+            fat, digit = divmod(fat, 26)
+            rad26 = chr(ord("A") + digit) + rad26
+        return rad26
 
     def __initialize_dbi3_serial_port(self):
         """Initialize the comm port for DBI3 communications.
@@ -204,11 +294,10 @@ class DBI3LogDownload:
                 break
 
         # ensure the DBI3 is in a good state
-        self.__do_DBI3_cmd(self.MD_MACH, self.RESP_OK)
-        self.__do_DBI3_cmd(self.FS_STOP, self.RESP_ANY)
+        self.__do_DBI3_prolog()
 
         # Get the actual device serial number from the DBI3
-        self.serial_fd.write(str.encode("sn\r"))
+        self.serial_fd.write(_SN_CMD)
         res = self.__readDbi3Line()
         if res == "":
             raise IOError("cmd sn: returned empty")
@@ -219,8 +308,9 @@ class DBI3LogDownload:
 
         To determine "new" logs we need to know the currently latest log in log_path
 
-        Do descending sort of the log_path, skip wrong length file names and non-files,
-        first successful strptime should be the latest log file.
+        Log names are fixed width YYYY_MM_DD_HH_MM_SS.log, so the largest name in that format
+        is the latest log.  Only that name needs to be parsed, a name with an invalid date is
+        skipped for the next largest.
 
         :action:  updates self.new_limit
         :param:
@@ -228,27 +318,41 @@ class DBI3LogDownload:
         """
         p_path = os.path.join(self.log_path, self.dbi3_sn)
         if os.path.isdir(p_path):
-            dt = None
-            # To minimize unnecessary file name, we immediately remove wrong length
-            # file names from the listdir output BEFORE sort.
-            for item in sorted(
-                [x for x in os.listdir(p_path) if len(x) == self.LOGNAME_LEN], reverse=True
-            ):
-                if not os.path.isfile(os.path.join(p_path, item)):
-                    continue  # skip non-files
+            # To minimize unnecessary file name, we immediately remove wrong length or format
+            # file names and non-files in the one scandir pass (no stat() per entry).
+            with os.scandir(p_path) as entries:
+                log_names = [
+                    entry.name
+                    for entry in entries
+                    if len(entry.name) == self.LOGNAME_LEN
+                    and _LOG_NAME_RE.fullmatch(entry.name)
+                    and entry.is_file()
+                ]
+            while log_names:
+                item = max(log_names)
                 try:
-                    # noinspection PyTypeChecker
-                    dt = datetime.strptime(item, "%Y_%m_%d_%H_%M_%S.log").replace(tzinfo=utc)
+                    # The format is already checked, the fields are sliced out of the fixed
+                    # width name.  datetime() still rejects out of range values.
+                    dt = datetime(
+                        int(item[0:4]),
+                        int(item[5:7]),
+                        int(item[8:10]),
+                        int(item[11:13]),
+                        int(item[14:16]),
+                        int(item[17:19]),
+                        0,
+                        utc,
+                    )
                 except ValueError as e:
                     if self.debug:
                         print("Parse error of {}:{}".format(item, e))
-                    continue  # skip wrong format file names
-                # The first valid strptime is the latest log file
-                if dt is not None:
-                    self.new_limit = dt + timedelta(seconds=1)
-                    if self.verbose:
-                        print("DBI3 new file threshold: {}".format(self.new_limit))
-                    break
+                    log_names.remove(item)  # skip wrong format file names
+                    continue
+                # The first valid date is the latest log file
+                self.new_limit = dt + timedelta(seconds=1)
+                if self.verbose:
+                    print("DBI3 new file threshold: {}".format(self.new_limit))
+                break
 
     def __do_DBI3_cmd(self, cmd, allowed_resp):
         """
@@ -262,14 +366,45 @@ class DBI3LogDownload:
         if self.serial_fd is None:
             # The first command ensures the serial port has been initialized.
             self.__initialize_dbi3_serial_port()
+        if self.queued_read is not None:
+            # A log read was requested ahead but not downloaded, clear its output first
+            self.queued_read = None
+            self.__skip_DBI3_log()
 
-        self.serial_fd.write(str.encode(cmd + "\r"))
+        self.serial_fd.write(cmd.encode() + b"\r")
         res = self.__readDbi3Line()
         # print 'fs stop result={}'.format(res)
         if res not in allowed_resp:
             raise IOError("cmd:{} expect:{} got:{}".format(cmd, allowed_resp, res))
         return res
 
+    def __do_DBI3_prolog(self):
+        """
+        Send the md mach and fs stop commands that start every operation in one write.
+
+        Both responses are read after the single write, the DBI3 answers the second command
+        without waiting for another USB round trip.
+
+        :raise IOerror:  If either response is not in the allowed list
+        """
+        if self.serial_fd is None:
+            # The first command ensures the serial port has been initialized.
+            self.__initialize_dbi3_serial_port()
+        if self.queued_read is not None:
+            # A log read was requested ahead but not downloaded, clear its output first
+            self.queued_read = None
+            self.__skip_DBI3_log()
+
+        self.serial_fd.write(_PROLOG_CMD)
+        # Read both responses before checking, a failed md mach doesn't leave the fs stop
+        # response behind for the next command
+        md_res = self.__readDbi3Line()
+        fs_res = self.__readDbi3Line()
+        if md_res not in self.RESP_OK:
+            raise IOError("cmd:{} expect:{} got:{}".format(self.MD_MACH, self.RESP_OK, md_res))
+        if fs_res not in self.RESP_ANY:
+            raise IOError("cmd:{} expect:{} got:{}".format(self.FS_STOP, self.RESP_ANY, fs_res))
+
     def get_DBI3_log_list(self, new_logs_only=None):
         """Retrieve the sorted DBI3 log list.
 
@@ -292,8 +427,7 @@ class DBI3LogDownload:
         if new_logs_only is None:  # optional param will override app_config
             new_logs_only = self.app_config.CLI_new_logs
 
-        self.__do_DBI3_cmd(self.MD_MACH, self.RESP_OK)
-        self.__do_DBI3_cmd(self.FS_STOP, self.RESP_ANY)
+        self.__do_DBI3_prolog()
 
         p_path = os.path.join(self.log_path, self.dbi3_sn)
 
@@ -304,26 +438,46 @@ class DBI3LogDownload:
         elif self.app_config.CLI_age_limit is not None:
             dt_limit = self.app_config.CLI_age_limit
 
-        self.serial_fd.write(str.encode("fs list\rmd mach\r"))
-        log_list = []
+        # Logs older than dt_limit are skipped by comparing the names, before any decoding
+        name_limit = None if dt_limit is None else self.__datetime_to_rad26(dt_limit)
+
+        # One scan of the SN directory gives every file name, the log and metadata file checks
+        # below are set lookups instead of two stat() calls per log
+        p_files = set()
+        if os.path.isdir(p_path):
+            with os.scandir(p_path) as entries:
+                p_files = {entry.name for entry in entries if entry.is_file()}
+
+        self.serial_fd.write(_FS_LIST_CMD)
+        log_entries = []  # LogList fields except the metadata
+        meta_files = []  # metadata file of each entry or None
 
         if self.verbose:
             print("RDT dt_limit:{} valid_only:{}".format(dt_limit, self.valid_only))
-        for res in iter(self.__readDbi3Line, None):
+        # The list is read in blocks of lines, each block is decoded in one pass
+        list_lines = []
+        complete = False
+        while not complete:
+            lines, complete = self.__readDbi3Lines()
+            if not lines:
+                if not complete:
+                    break  # timeout
+                continue
+            list_lines.extend(b"\n".join(lines).decode("utf8").split("\n"))
+        # List ended, we got the ok/nok from the md mach command.
+
+        for res in list_lines:
             if self.verbose:
                 print("RDT logs {}".format(res))
-            if res == "ok" or res == "nok":
-                # List ended, we got the ok/nok from the md mach command.
-                break
             rs = res.split(" ")
-            start_dt = self.__fat_to_datetime(rs[0])
             # To handle scaling of the list, at this level we can ignore logs that are older that age_limit
-            if dt_limit is not None and start_dt < dt_limit:
+            if name_limit is not None and rs[0] < name_limit:
                 continue
+            start_dt = self.__fat_to_datetime(rs[0])
             stop_dt = self.__fat_to_datetime(rs[1])
 
             # Compute the log file basename from the RAD26 start time string
-            log_basename = start_dt.strftime("%Y_%m_%d_%H_%M_%S")
+            log_basename = self.__fat_to_basename(rs[0])
             log_name = log_basename + ".log"
             log_metaname = "." + log_basename  # hidden filename for conversion metadata
 
@@ -337,27 +491,28 @@ class DBI3LogDownload:
                         )
                     continue
 
-            log_file = os.path.join(p_path, log_name)
-            log_metafile = os.path.join(p_path, log_metaname)
-
             # Check if the log file exists on the PC
-            if not os.path.isfile(log_file):
+            if log_name not in p_files:
                 download = True
             else:
                 download = False
 
-            # If the log metadata file exists, load the dictionary
-            metadata = None
-            if os.path.isfile(log_metafile):
+            # If the log metadata file exists, it is loaded after the list is read
+            if log_metaname in p_files:
                 # meta file to override some conversion settings
-                with open(log_metafile, "r") as meta:
-                    metadata = json.load(meta)
+                meta_files.append(os.path.join(p_path, log_metaname))
+            else:
+                meta_files.append(None)
 
-            log_list.append(
-                LogList(
-                    rs[0], rs[1], start_dt, stop_dt, log_name, download, log_metaname, metadata
-                )
-            )
+            log_entries.append((rs[0], rs[1], start_dt, stop_dt, log_name, download, log_metaname))
+
+        # Load the metadata dictionaries in a thread pool, the file reads overlap
+        if any(meta_files):
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                metadata = list(pool.map(_load_metadata, meta_files))
+        else:
+            metadata = [None] * len(log_entries)
+        log_list = [LogList(*entry, meta) for entry, meta in zip(log_entries, metadata)]
 
         log_list.sort()
         if self.verbose:
@@ -371,12 +526,11 @@ class DBI3LogDownload:
         return log_list
 
     def delete_DBI3_log(self, name):
-        start_dt = datetime.now(utc)
+        start_time = monotonic()  # calculate elapsed time of the delete
         print("Deleting log {}".format(name))
-        self.__do_DBI3_cmd(self.MD_MACH, self.RESP_OK)
-        self.__do_DBI3_cmd(self.FS_STOP, self.RESP_ANY)
+        self.__do_DBI3_prolog()
 
-        self.serial_fd.write(str.encode("fs del {}\r".format(name)))
+        self.serial_fd.write(b"fs del " + name.encode() + b"\r")
         orig_timeout = self.serial_fd.timeout
         # DELETE appears to have no response, so a "md mach" is queued to produce an OK/NOK
         self.serial_fd.timeout = 20
@@ -384,7 +538,7 @@ class DBI3LogDownload:
         self.serial_fd.timeout = orig_timeout
         print(
             "fs delete result={}({}) in {:0.2f} seconds".format(
-                res, len(res), (datetime.now(utc) - start_dt).total_seconds()
+                res, len(res), monotonic() - start_time
             )
         )
         return True
@@ -464,8 +618,7 @@ class DBI3LogDownload:
         self.cfg_dict = {}
 
         # Ensure the cli is clear and initialized
-        self.__do_DBI3_cmd(self.MD_MACH, self.RESP_OK)
-        self.__do_DBI3_cmd(self.FS_STOP, self.RESP_ANY)
+        self.__do_DBI3_prolog()
 
         for cfg in self.CFG_COMMANDS:
             cfg_report.append("\nCONFIG-{}".format(cfg[1]))
@@ -492,7 +645,7 @@ class DBI3LogDownload:
         :param str cmd:  the config cmd
         :return list,str:  the stripped strings resulting from the config cmd
         """
-        self.serial_fd.write(str.encode("{}\rmd mach\r".format(cmd)))
+        self.serial_fd.write(cmd.encode() + b"\rmd mach\r")
 
         log_list = []
 
@@ -527,15 +680,17 @@ class DBI3LogDownload:
         log_list = []
 
         if subcmds is None:
-            self.serial_fd.write(str.encode("{}\r".format(cmd)))
+            self.serial_fd.write(cmd.encode() + b"\r")
             res = self.__readDbi3Line()
             log_list.append("{}".format(res))
             self.cfg_dict[cmd]["value"] = res
         else:
             # noinspection PyTypeChecker
             self.cfg_dict[cmd]["subcmd"] = {}
+            # Send every subcmd in one write, the DBI3 answers them in order with one line each
+            cmd_lines = "".join("{} {}\r".format(cmd, sub[0]) for sub in subcmds)
+            self.serial_fd.write(cmd_lines.encode())
             for sub in subcmds:
-                self.serial_fd.write(str.encode("{} {}\r".format(cmd, sub[0])))
                 line = self.__readDbi3Line()
                 res = "{}={}".format(sub[0], line)
                 # noinspection PyTypeChecker
@@ -567,30 +722,35 @@ class DBI3LogDownload:
         # are removed (DBI3 EOL is \n\r which is reverse from TTY standard)
 
         # First thing, check if the buffer already has a complete line to return.
-        i = self.readline_buf.find(b"\n")
+        i = self.readline_buf.find(b"\n", self.readline_pos)
         if i >= 0:
-            # Return the line and remove it from the buffer
-            r = self.readline_buf[:i]
-            self.readline_buf = self.readline_buf[i + 1 :]
+            # Return the line and step past it, the buffer tail is not copied for each line
+            r = self.readline_buf[self.readline_pos : i]
+            self.readline_pos = i + 1
             return r.decode("utf8").strip()
+        # No complete line left, drop the lines already returned before reading more
+        del self.readline_buf[: self.readline_pos]
+        self.readline_pos = 0
         while True:
-            i = max(1, min(2048, self.serial_fd.in_waiting))
-            data = self.serial_fd.read(i)
+            # Take everything already received in one read, no cap on the block size.  With
+            # nothing waiting, block for a single byte: a larger fixed read size would wait
+            # for the serial timeout after every short response.
+            data = self.serial_fd.read(self.serial_fd.in_waiting or 1)
             if len(data) == 0:
                 # zero data means this was a timeout and terminates read
                 if len(self.readline_buf) != 0:
                     # This is probably an error!
                     print("RDT read timeout for EOL with data {}".format(data))
                 return ""
-            i = data.find(b"\n")
+            # Append in place and only search the new data for the NL, the remaining data stays
+            # in the buffer behind readline_pos
+            start = len(self.readline_buf)
+            self.readline_buf.extend(data)
+            i = self.readline_buf.find(b"\n", start)
             if i >= 0:
-                # Found NL in read, prefix with any prior data, save remaining data
-                r = self.readline_buf + data[:i]
-                self.readline_buf[0:] = data[i + 1 :]
+                r = self.readline_buf[:i]
+                self.readline_pos = i + 1
                 return r.decode("utf8").strip()
-            else:
-                # No NL yet, add to existing data and read again
-                self.readline_buf.extend(data)
         # output = ''
         # len_eol = len(self.DBI3_EOL)
         # while True:
@@ -604,44 +764,130 @@ class DBI3LogDownload:
         #         break
         # return output[0:-len_eol].strip()  # trim eol and white space off the return
 
-    def get_DBI3_log(self, name):
+    def __request_DBI3_log(self, name):
+        """Send the read command for a log, the 'md mach' ok/nok marks the end of the log.
+
+        :param str name: rad26 name of the DBI3 log
+        """
+        self.serial_fd.write(b"fs read " + name.encode() + b"\rmd mach\r")
+
+    def __skip_DBI3_log(self):
+        """Read and discard the output of a log read that was requested but is not wanted."""
+        for res in iter(self.__readDbi3Line, ""):
+            if res == "ok" or res == "nok":
+                break
+
+    def __drain_DBI3_reads(self):
+        """Discard the rest of the current log read and of any queued read after a timeout."""
+        queued_read = self.queued_read
+        self.queued_read = None
+        self.__skip_DBI3_log()
+        if queued_read is not None:
+            self.__skip_DBI3_log()
+
+    def __readDbi3Lines(self):
+        """Read serial port until a block of complete lines or timeout.
+
+        The bytes level counterpart of __readDbi3Line() for long outputs, every complete line
+        already received is split and stripped in one pass without a decode per line.  Lines
+        are returned up to the ok/nok line that ends the output (the 'md mach' response), any
+        data after that is left buffered for the next read.  Blank lines are dropped.
+
+        :return tuple:
+            - list,bytes: stripped lines, empty on timeout
+            - bool: True if the ok/nok end of the output was found
+        """
+        while True:
+            end = self.readline_buf.rfind(b"\n")
+            if end >= self.readline_pos:
+                break
+            # No complete line left, drop the lines already returned before reading more
+            del self.readline_buf[: self.readline_pos]
+            self.readline_pos = 0
+            data = self.serial_fd.read(self.serial_fd.in_waiting or 1)
+            if len(data) == 0:
+                # zero data means this was a timeout and terminates read
+                if len(self.readline_buf) != 0:
+                    # This is probably an error!
+                    print("RDT read timeout for EOL with data {}".format(data))
+                return [], False
+            self.readline_buf.extend(data)
+
+        # Copy the block out through a memoryview, a bytearray slice would copy it twice
+        with memoryview(self.readline_buf) as view:
+            block = view[self.readline_pos : end].tobytes()
+        m = _RESP_END_RE.search(block)
+        if m is not None:
+            # Stop after the ok/nok line, a following output stays in the buffer
+            self.readline_pos += m.end() + 1
+            block = block[: m.start()]
+        else:
+            self.readline_pos = end + 1
+        return [line for line in map(bytes.strip, block.split(b"\n")) if line], m is not None
+
+    def get_DBI3_log(self, name, next_name=None):
         """Down load the specified log from the DBI3 serial connection.
 
-        Read and write the log one line at a time to avoid massive buffers
-        from a very long duration log.
+        The log is read and written in blocks of the lines already received, each block is
+        written as bytes through a 64 KiB file buffer.  Memory use stays bounded by the block
+        size, not the length of a very long duration log.
+
+        When the caller knows the next log it will download, next_name queues that read
+        command behind this log.  The DBI3 then streams the next log as soon as this one ends,
+        the next get_DBI3_log(next_name) call skips the command setup round trips and doesn't
+        wait for the first line.
 
         :param str name: rad26 name of the DBI3 log to download
+        :param str next_name: optional rad26 name of the log that will be downloaded next
         :return str:  Report of the download results
+        :raise IOError:  If the log read times out before its end, the partial log is removed
         """
-        self.__do_DBI3_cmd(self.MD_MACH, self.RESP_OK)
-        self.__do_DBI3_cmd(self.FS_STOP, self.RESP_ANY)
+        if self.queued_read == name:
+            self.queued_read = None  # already requested by the previous get_DBI3_log()
+        else:
+            self.__do_DBI3_prolog()
+            self.__request_DBI3_log(name)
+        if next_name is not None:
+            self.__request_DBI3_log(next_name)
+            self.queued_read = next_name
 
         p_path = os.path.join(self.log_path, self.dbi3_sn)
         if not os.path.isdir(p_path):
             os.mkdir(p_path)
-        start_dt = self.__fat_to_datetime(name)
-        log_name = start_dt.strftime("%Y_%m_%d_%H_%M_%S.log")
+        log_name = self.__fat_to_basename(name) + ".log"
         log_file = os.path.join(p_path, log_name)
 
-        self.serial_fd.write(str.encode("fs read {}\rmd mach\r".format(name)))
-
         line_count = 0
-        beg_down = datetime.now()  # calculate elapsed time to read log
+        beg_down = monotonic()  # calculate elapsed time to read log
         # Don't open the log until we have at least one line
-        res = self.__readDbi3Line()
-        if res is None or res == "":
+        lines, complete = self.__readDbi3Lines()
+        if not lines and not complete:
             print("LOG-{} zero length".format(name))
+            # No response yet, drain a late answer to this read and to a queued read so the
+            # next command starts with a clean stream
+            self.__drain_DBI3_reads()
             return
 
-        with open(log_file, "w") as log_out:
-            while res:
-                if res == "ok" or res == "nok":
-                    # this is the 'md mach' response, the log is complete
+        # Each block of lines is written with one write(), the log stays as the received bytes
+        # with the platform line ending as a text file would have.  The blocks are as small as
+        # the serial reads, the larger file buffer collects them into fewer OS writes.
+        eol = os.linesep.encode()
+        with open(log_file, "wb", buffering=_LOG_WRITE_BUFFER) as log_out:
+            while lines:
+                line_count += len(lines)
+                lines.append(b"")  # line ending after the last line of the block
+                log_out.write(eol.join(lines))
+                if complete:
+                    # the block ended with the 'md mach' response, the log is complete
                     break
-                line_count += 1
-                log_out.write(res + "\n")
-                res = self.__readDbi3Line()
-        minutes, seconds = divmod((datetime.now() - beg_down).total_seconds(), 60)
+                lines, complete = self.__readDbi3Lines()
+        if not complete:
+            # Timeout before the end of the log.  Drain whatever the DBI3 still sends for this
+            # log and for a queued read, the next command starts again with the prolog.
+            self.__drain_DBI3_reads()
+            os.remove(log_file)  # a partial log would be taken as downloaded
+            raise IOError("LOG-{} read timeout after {} records".format(name, line_count))
+        minutes, seconds = divmod(monotonic() - beg_down, 60)
         minutes = int(minutes)
         return "LOG download-{} ({} records in {:02d}:{:06.3f})".format(
             log_name, line_count, minutes, seconds
@@ -657,10 +903,10 @@ class DBI3LogDownload:
             :return str[]: Reports of log_list download results
        """
 
-        # Download all logs that we don't already have
+        # Download all logs that we don't already have, each read queues the next one
+        names = [rs.name_start for rs in log_list if rs.new_file]
         ret = []
-        for rs in log_list:
-            if rs.new_file:
-                ret.append(self.get_DBI3_log(rs.name_start))
+        for name, next_name in zip(names, names[1:] + [None]):
+            ret.append(self.get_DBI3_log(name, next_name))
 
         return ret
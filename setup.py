@@ -21,9 +21,13 @@ setup(
     use_scm_version=True,
     setup_requires=["setuptools_scm"],
     entry_points={"console_scripts": ["DBI3cli=dbi3_access.dbi3_main:main"],},
+    # asyncio.run() and contextlib.nullcontext() need Python 3.7
+    python_requires=">=3.7",
     # Project uses reStructuredText, so ensure that the docutils get
     # installed or upgraded on the target machine
     install_requires=["pyserial>=3.4", "setuptools-scm>=3.1.0", "simplekml>=1.3.0",],
+    # Feather/Parquet data output as an alternative to CSV
+    extras_require={"arrow": ["pyarrow"]},
     package_data={
         # If any package contains *.txt or *.rst files, include them:
         "": ["*.md", "*.odt"],